@@ -3,14 +3,32 @@ Textual DSL parser implementation.
 """
 
 import re
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from ..core.models import NodeShape, EdgeStyle, Direction
-from ..utils.exceptions import DSLParseError
+from ..utils.exceptions import DotFlowError, DSLParseError
+from ..utils.validators import validate_label
+
+# Connection and node definition in a single alternation.
+# Token runs are atomic groups so a mismatch fails without backtracking.
+_LINE_RE = re.compile(
+    r"(?P<from>(?>[a-zA-Z_]\w*))(?>\s*)(?:\{(?P<mods>(?>[^}]+))\})?(?>\s*)->(?>\s*)"
+    r"(?P<to>(?>[a-zA-Z_]\w*))(?>\s*)(?::(?>\s*)(?P<lbl>.+))?$"
+    r"|(?P<node>(?>[a-zA-Z_]\w*))(?>\s*)\[(?P<attrs>.+)\]$"
+)
+_SHAPE_BY_UPPER = {shape.name: shape for shape in NodeShape}
+# Connection modifiers in priority order: "A {dashed} -> B"
+_MOD_STYLES = (
+    ("dashed", EdgeStyle.DASHED),
+    ("dotted", EdgeStyle.DOTTED),
+    ("bold", EdgeStyle.BOLD),
+)
 
 
 class TextualDSL:
     """Textual Domain Specific Language parser."""
 
+    __slots__ = ("_interpreter",)
+
     def __init__(self, interpreter: "DotInterpreter"):
         self._interpreter = interpreter
 
@@ -24,51 +42,90 @@ class TextualDSL:
         - Decisions: "A {decision} -> B : Yes"
         - Comments: "# This is a comment"
         """
-        lines = dsl_text.strip().split("\n")
-        line_number = 0
+        return self.parse_dsl_stream(dsl_text.strip().split("\n"))
+
+    def parse_dsl_stream(self, lines_iter: Iterable[str]) -> "DotInterpreter":
+        """
+        Parse DSL input one line at a time.
 
-        for line in lines:
-            line_number += 1
+        Accepts any iterable of lines, such as an open file, so large
+        inputs never have to be held in memory as a single string.
+        Connections are collected and added in one batch once every line
+        has been read.
+        """
+        pending = []
+
+        for line_number, line in enumerate(lines_iter, 1):
             line = line.strip()
 
             if not line or line.startswith("#"):
                 continue
 
-            try:
-                self._parse_line(line, line_number)
-            except Exception as e:
-                raise DSLParseError(f"Error parsing line {line_number}: {line}") from e
+            connection = self._parse_line(line, line_number)
+            if connection:
+                pending.append((line_number, line, connection))
+
+        try:
+            self._interpreter.connect_many(connection for _, _, connection in pending)
+        except DotFlowError as e:
+            line_number, line = self._failed_connection(pending)
+            raise DSLParseError(f"Error parsing line {line_number}: {line}") from e
 
         return self._interpreter
 
-    def _parse_line(self, line: str, line_number: int):
-        """Parse a single line of DSL text."""
-        # Try node connection first: "A -> B : Label"
-        connection_match = re.match(
-            r"(\w+)\s*(?:\{([^}]+)\})?\s*->\s*(\w+)\s*(?::\s*(.+))?", line
-        )
-        if connection_match:
-            from_node, modifiers, to_node, label = connection_match.groups()
-            self._parse_connection(from_node, to_node, label, modifiers)
-            return
-
-        # Try node definition: "A [shape=rect, label='Custom']"
-        node_match = re.match(r"(\w+)\s*\[(.+)\]", line)
-        if node_match:
-            node_id, attrs_str = node_match.groups()
-            self._parse_node_definition(node_id, attrs_str)
-            return
-
-        # Try standalone node: "A"
-        if re.match(r"^\w+$", line):
-            self._interpreter.process(line)
-            return
+    def _failed_connection(self, pending) -> Tuple[int, str]:
+        """Line number and text of the first pending connection that fails."""
+        has_node = self._interpreter.has_node
+        for line_number, line, (from_node, to_node, label, _) in pending:
+            if not (has_node(from_node) and has_node(to_node)):
+                return line_number, line
+            try:
+                validate_label(label)
+            except DotFlowError:
+                return line_number, line
+        return pending[-1][:2]
+
+    def _parse_line(
+        self, line: str, line_number: int
+    ) -> Optional[Tuple[str, str, Optional[str], EdgeStyle]]:
+        """Parse a single line of DSL text, returning any connection found."""
+        match = None
+
+        # Without "->" or "[" only a standalone node can match: "A"
+        if "->" in line or "[" in line:
+            match = _LINE_RE.match(line)
+            if match is None:
+                raise DSLParseError(
+                    f"Unrecognized DSL syntax at line {line_number}: {line}"
+                )
+
+            # Node connection: "A -> B : Label"
+            if match.group("from"):
+                return self._parse_connection(
+                    match.group("from"),
+                    match.group("to"),
+                    match.group("lbl"),
+                    match.group("mods"),
+                )
+        elif not line.isidentifier():
+            raise DSLParseError(
+                f"Unrecognized DSL syntax at line {line_number}: {line}"
+            )
 
         # Try dg attributes deirection=LR
         # if re.match(r"^\w+=\s", line):
         #  return
 
-        raise DSLParseError(f"Unrecognized DSL syntax at line {line_number}")
+        try:
+            if match:
+                # Node definition: "A [shape=rect, label='Custom']"
+                self._parse_node_definition(match.group("node"), match.group("attrs"))
+            else:
+                self._interpreter.process(line)
+        except (DotFlowError, ValueError) as e:
+            raise DSLParseError(f"Error parsing line {line_number}: {line}") from e
+
+        return None
 
     def _parse_connection(
         self,
@@ -76,38 +133,33 @@ class TextualDSL:
         to_node: str,
         label: Optional[str],
         modifiers: Optional[str],
-    ):
+    ) -> Tuple[str, str, Optional[str], EdgeStyle]:
         """Parse a connection between nodes."""
         style = EdgeStyle.SOLID
 
         if modifiers:
-            if "dashed" in modifiers:
-                style = EdgeStyle.DASHED
-            elif "dotted" in modifiers:
-                style = EdgeStyle.DOTTED
-            elif "bold" in modifiers:
-                style = EdgeStyle.BOLD
+            for keyword, modifier_style in _MOD_STYLES:
+                if keyword in modifiers:
+                    style = modifier_style
+                    break
 
-        self._interpreter.connect(from_node, to_node, label, style)
+        return from_node, to_node, label, style
 
     def _parse_node_definition(self, node_id: str, attrs_str: str):
         """Parse node attributes definition."""
         attrs = {}
 
-        # Simple attribute parsing
-        for attr_match in re.finditer(r"(\w+)\s*=\s*([^,]+)", attrs_str):
-            key, value = attr_match.groups()
-            attrs[key.strip()] = value.strip().strip("'\"")
+        # Simple attribute parsing: "key=value, key='value'"
+        for part in attrs_str.split(","):
+            key, sep, value = part.partition("=")
+            if sep:
+                attrs[key.strip()] = value.strip().strip("'\"")
 
         shape = NodeShape.RECTANGLE
         label = node_id
 
         if "shape" in attrs:
-            shape_name = attrs["shape"].upper()
-            try:
-                shape = NodeShape[shape_name]
-            except KeyError:
-                shape = NodeShape.RECTANGLE
+            shape = _SHAPE_BY_UPPER.get(attrs["shape"].upper(), NodeShape.RECTANGLE)
 
         if "label" in attrs:
             label = attrs["label"]
@@ -1,3 +1,4 @@
+from functools import cached_property
 from .pythonic import PythonicAPI
 from .dsl import TextualDSL
 from ..core.interpreter import DotInterpreter
@@ -7,7 +8,7 @@ from ..core.interpreter import DotInterpreter
 class PythonicAPIMixin:
     """Mixin to add Pythonic API methods to DotInterpreter."""
 
-    @property
+    @cached_property
     def py(self) -> PythonicAPI:
         """Access Pythonic API methods."""
         return PythonicAPI(self)
@@ -17,7 +18,7 @@ class PythonicAPIMixin:
 class TextualDSLMixin:
     """Mixin to add textual DSL methods to DotInterpreter."""
 
-    @property
+    @cached_property
     def dsl(self) -> TextualDSL:
         """Access textual DSL parser."""
         return TextualDSL(self)
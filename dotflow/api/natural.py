@@ -2,32 +2,43 @@
 Natural language API implementation using operator overloading.
 """
 
-from typing import Union, Optional
-from ..core.models import EdgeStyle
+from functools import lru_cache
+from typing import Iterable, Tuple, Union, Optional
+from ..core.models import Edge, EdgeStyle
+from ..utils.exceptions import ValidationError
 from ..utils.validators import validate_node_id
 
+# Node ids repeat heavily across hops; only successful validations are cached
+_validate = lru_cache(maxsize=1024)(validate_node_id)
+
 
 class NaturalLanguageAPI:
     """Natural language API using operator overloading."""
 
+    __slots__ = ("_interpreter", "_last_node", "_pending_label", "_last_edge")
+
     def __init__(self, interpreter: "DotInterpreter"):
         self._interpreter = interpreter
         self._last_node: Optional[str] = None
         self._pending_label: Optional[str] = None
+        self._last_edge: Optional[Edge] = None
 
     def __rshift__(
         self, other: Union[str, "NaturalLanguageAPI"]
     ) -> "NaturalLanguageAPI":
         """Override >> operator for flow creation: flow >> "A" >> "B" """
         if isinstance(other, str):
-            validate_node_id(other)
+            _validate(other)
             if self._last_node:
                 # Create connection from last node to new node
-                self._interpreter.connect(self._last_node, other, self._pending_label)
+                self._last_edge = self._interpreter.link(
+                    self._last_node, other, self._pending_label
+                )
                 self._pending_label = None
             else:
                 # Start new flow
                 self._interpreter.start(other)
+                self._last_edge = None
 
             self._last_node = other
             return self
@@ -43,22 +54,62 @@ class NaturalLanguageAPI:
 
     def __getitem__(self, key: str) -> "NaturalLanguageAPI":
         """Override [] for conditional flows: flow >> "A" >> "B"["Label"]"""
-        if isinstance(key, str) and self._last_node and self._interpreter.edges:
-            # Find the most recent edge and update its label
-            for edge in reversed(self._interpreter.edges):
-                if edge.to_node == self._last_node:
-                    edge.label = key
-                    break
+        if isinstance(key, str) and self._last_edge is not None:
+            # Label the edge created by the most recent hop
+            self._interpreter.relabel_edge(self._last_edge, key)
         return self
 
     def __floordiv__(self, other: str) -> "NaturalLanguageAPI":
         """Override // for dashed connections: flow >> "A" // "B" """
         if isinstance(other, str) and self._last_node:
-            self._interpreter.connect(self._last_node, other, style=EdgeStyle.DASHED)
+            self._last_edge = self._interpreter.link(
+                self._last_node, other, style=EdgeStyle.DASHED
+            )
             self._last_node = other
         return self
 
+    def build(self, ops: Iterable[Tuple[str, str]]) -> "NaturalLanguageAPI":
+        """
+        Apply a sequence of operations in a single call.
+
+        ("node", "A") acts like >> "A", ("label", "Yes") like | "Yes" and
+        ("dashed", "B") like // "B". Operator chains read better, but this
+        skips per-operator dispatch and is the faster path for large flows.
+        """
+        interpreter = self._interpreter
+        link = interpreter.link
+        last_node = self._last_node
+        pending_label = self._pending_label
+        last_edge = self._last_edge
+
+        try:
+            for op, arg in ops:
+                if op == "node":
+                    _validate(arg)
+                    if last_node:
+                        last_edge = link(last_node, arg, pending_label)
+                        pending_label = None
+                    else:
+                        interpreter.start(arg)
+                        last_edge = None
+                    last_node = arg
+                elif op == "label":
+                    pending_label = arg
+                elif op == "dashed":
+                    if last_node:
+                        last_edge = link(last_node, arg, style=EdgeStyle.DASHED)
+                        last_node = arg
+                else:
+                    raise ValidationError(f"Unknown build operation: '{op}'")
+        finally:
+            self._last_node = last_node
+            self._pending_label = pending_label
+            self._last_edge = last_edge
+
+        return self
+
     def reset(self):
         """Reset the state for a new flow."""
         self._last_node = None
         self._pending_label = None
+        self._last_edge = None
@@ -10,6 +10,8 @@ from ..utils.validators import validate_node_id, validate_label
 class PythonicAPI:
     """Pythonic API methods for DotInterpreter."""
 
+    __slots__ = ("_interpreter",)
+
     def __init__(self, interpreter: "DotInterpreter"):
         self._interpreter = interpreter
 
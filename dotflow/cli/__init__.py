@@ -2,6 +2,13 @@
 DotFlow CLI module.
 """
 
-from .main import cli
-
 __all__ = ["cli"]
+
+
+def __getattr__(name: str):
+    """Import the click-based CLI only when it is first accessed."""
+    if name == "cli":
+        from .main import cli
+
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
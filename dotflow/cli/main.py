@@ -4,18 +4,14 @@ Main CLI entry point for DotFlow.
 
 import os
 import sys
-import time
 import click
 import platform
 import subprocess
-from PIL import Image
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from ..core.interpreter import DotInterpreter
 from ..core.themes import Theme
 from ..core.models import Direction, NodeShape
-from ..exporters.image import ImageExporter
-from ..exporters.dot import DotExporter
 from ..utils.exceptions import DotFlowError
 from ..utils.colors import fg, bg, rs
 from ..utils.validators import node_id_validator
@@ -23,6 +19,84 @@ from ..utils.screen import clear_screen
 
 RESET = rs
 
+_THEME_CHOICES = tuple(t.value for t in Theme)
+_DIR_CHOICES = tuple(d.value for d in Direction)
+_FMT_CHOICES = ("png", "svg", "pdf", "dot")
+
+_THEME_DESCRIPTIONS: Dict[Theme, str] = {
+    Theme.DEFAULT: "Clean black and white",
+    Theme.DARK: "Dark mode with light text",
+    Theme.COLORFUL: "Bright yellow nodes",
+    Theme.BLUE: "Blue color scheme",
+    Theme.GREEN: "Green color scheme",
+    Theme.MONOCHROME: "Simple monochrome",
+}
+
+# Wizard menus, built once so each loop iteration is a single write
+_MENU_FOOTER = f"  8. {fg.LBLUE}More Options{RESET}\n  9. Exit session"
+_TOP_MENU = "\n".join(
+    [
+        f"{fg.DWHITE}Options:{RESET}",
+        "  1. Add start node (ellipse)",
+        "  2. Add process node (rect)",
+        "  3. Add decision node (diamond)",
+        "  4. Add end node",
+        "  5. Connect nodes",
+        f"  6. Add cluster({fg.LBLUE}subgraph{RESET})",
+        "  7. Finish and generate",
+        _MENU_FOOTER,
+    ]
+)
+_SUBGRAPH_MENU = "\n".join(
+    [
+        f"{fg.DWHITE}Options:{RESET}",
+        "  1. Add subgraph start node (ellipse)",
+        "  2. Add subgraph process node (rect)",
+        "  3. Add subgraph decision node (diamond)",
+        "  4. Add subgraph end node",
+        "  5. Connect subgraph nodes",
+        f"  6. Add sub-cluster({fg.LBLUE}sub-subgraph{RESET})",
+        "  7. Exit subgraph",
+        _MENU_FOOTER,
+    ]
+)
+_MORE_OPTIONS_MENU = "\n".join(
+    [
+        "  10. Save Progess",
+        "  11. Preview diagram",
+        "  12. View flow",
+        "  13. Clear Screen",
+    ]
+)
+
+# Options shared by several commands, built once
+_name_opt = click.option(
+    "--name", "-n", default="flow", help="Name of the flow diagram"
+)
+_theme_opt = click.option(
+    "--theme",
+    "-t",
+    type=click.Choice(_THEME_CHOICES),
+    default="default",
+    help="Color theme for the diagram",
+)
+_format_opt = click.option(
+    "--format",
+    "-f",
+    type=click.Choice(_FMT_CHOICES),
+    default="png",
+    help="Output format",
+)
+
+
+def _checked_node_id(node_id: str) -> str:
+    """click.prompt value_proc: re-prompt until the node id is valid."""
+    if not node_id_validator(node_id):
+        raise click.BadParameter(
+            f"{fg.RED}Invalid node id. {fg.MAGENTA}Must start with a letter or underscore{RESET}"
+        )
+    return node_id
+
 
 @click.group()
 @click.version_option()
@@ -33,28 +107,16 @@ def cli():
 
 @cli.command()
 @click.argument("output", type=click.Path(), default=os.path.curdir)
-@click.option("--name", "-n", default="flow", help="Name of the flow diagram")
-@click.option(
-    "--theme",
-    "-t",
-    type=click.Choice([t.value for t in Theme]),
-    default="default",
-    help="Color theme for the diagram",
-)
+@_name_opt
+@_theme_opt
 @click.option(
     "--direction",
     "-d",
-    type=click.Choice([d.value for d in Direction]),
+    type=click.Choice(_DIR_CHOICES),
     default="TB",
     help="Layout direction",
 )
-@click.option(
-    "--format",
-    "-f",
-    type=click.Choice(["png", "svg", "pdf", "dot"]),
-    default="png",
-    help="Output format",
-)
+@_format_opt
 @click.option("--dsl-file", "-i", type=click.File("r"), help="Input DSL file")
 @click.option("--dsl-text", "-s", help="DSL text directly from command line")
 def generate(
@@ -74,30 +136,31 @@ def generate(
             name=name, theme=Theme(theme), direction=Direction(direction)
         )
 
-        # Get DSL content
-        dsl_content = ""
+        # Parse DSL and generate diagram; files are streamed line by line
         if dsl_file:
-            dsl_content = dsl_file.read()
+            flow.parse_dsl_stream(dsl_file)
         elif dsl_text:
-            dsl_content = dsl_text
+            flow.parse_dsl(dsl_text)
         else:
             click.echo(
                 "Error: Either --dsl-file or --dsl-text must be provided", err=True
             )
             sys.exit(1)
 
-        # Parse DSL and generate diagram
-        flow.parse_dsl(dsl_content)
-
         # Remove initial extension
         output = f"{output.split('.', 1)[0]}.{format}"
+        dot_source = flow.to_dot()
         # Export based on format
         if format == "dot":
+            from ..exporters.dot import DotExporter
+
             exporter = DotExporter()
-            exporter.export(flow.to_dot(), output)
+            exporter.export(dot_source, output)
         else:
+            from ..exporters.image import ImageExporter
+
             exporter = ImageExporter()
-            exporter.export(flow.to_dot(), output, format)
+            exporter.export(dot_source, output, format)
 
         click.echo(f"Successfully generated {format.upper()} diagram: {output}")
 
@@ -111,14 +174,8 @@ def generate(
 
 @cli.command()
 @click.argument("output", type=click.Path())
-@click.option("--name", "-n", default="flow", help="Name of the flow diagram")
-@click.option(
-    "--theme",
-    "-t",
-    type=click.Choice([t.value for t in Theme]),
-    default="default",
-    help="Color theme for the diagram",
-)
+@_name_opt
+@_theme_opt
 @click.option("--interactive", "-i", is_flag=True, help="Interactive mode")
 def wizard(output: str, name: str, theme: str, interactive: bool):
     """Interactive wizard for creating flow diagrams."""
@@ -131,6 +188,9 @@ def wizard(output: str, name: str, theme: str, interactive: bool):
         else:
             _run_quick_wizard(flow)
 
+        from ..exporters.dot import DotExporter
+        from ..exporters.image import ImageExporter
+
         # Always generate both DOT and PNG
         dot_exporter = DotExporter()
         image_exporter = ImageExporter()
@@ -138,16 +198,18 @@ def wizard(output: str, name: str, theme: str, interactive: bool):
         dot_path = Path(output).with_suffix(".dot")
         png_path = Path(output).with_suffix(".png")
 
-        dot_exporter.export(flow.to_dot(), str(dot_path))
-        image_exporter.export(flow.to_dot(), str(png_path))
+        # Render once and hand the same source to both exporters
+        dot_source = flow.to_dot()
+        dot_exporter.export(dot_source, str(dot_path))
+        image_exporter.export(dot_source, str(png_path))
 
         click.echo(f"{fg.GREEN}Successfully generated{RESET}:")
         click.echo(f"  - DOT file: {fg.BLUE}{dot_path}{RESET}")
         click.echo(f"  - PNG file: {fg.BLUE}{png_path}{RESET}")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, click.Abort):
         click.echo("\nQuit")
-        sys.exist(1)
+        sys.exit(1)
     except DotFlowError as e:
         click.echo(f"{fg.RED}Error: {fg.YELLOW}{e}{RESET}", err=True)
         # sys.exit(1)
@@ -162,35 +224,55 @@ class InterractiveSession:
     def __init__(self, flow: DotInterpreter, output=click.Path()):
         self.flow = flow
         self.output = output
+        # Checkpoint/preview files sit next to the output, minus its extension;
+        # a bare directory such as "." gets files named after the flow
+        output_base = Path(output)
+        if output_base.name:
+            output_base = output_base.with_suffix("")
+        else:
+            output_base /= flow.name
+        self._checkpoint_path = output_base.with_name(
+            f"{output_base.name}_checkpoint.dot"
+        )
+        self._preview_path = output_base.with_name(f"{output_base.name}_preview.png")
         click.echo("🐍 DotFlow Interactive Wizard")
         click.echo("=" * 40)
 
-        self.nodes = []
+        # Insertion-ordered set of node ids, including nodes inside clusters
+        self.nodes: Dict[str, None] = {}
         self.current_node = None
-        self.method_map = {
-            1: self.add_node,
-            2: self.add_process,
-            3: self.add_decision,
-            4: self.add_end,
-            5: self.connect_nodes,
-            6: self.add_cluster,
-            # 7: exit subgraph
-            # 8: self.all_options,
-            # 9: exit
-            10: self.save_progress,
-            11: self.preview_diagram,
-            12: self.show_flow,
-            13: self.clear_screen,
-        }
+        # Menu actions indexed by option number; None marks options that
+        # are handled inline (7 finish, 8 more options, 9 exit)
+        self._dispatch = (
+            None,
+            self.add_node,
+            self.add_process,
+            self.add_decision,
+            self.add_end,
+            self.connect_nodes,
+            self.add_cluster,
+            None,
+            None,
+            None,
+            self.save_progress,
+            self.preview_diagram,
+            self.show_flow,
+            self.clear_screen,
+        )
         self.cluster_nodes = []
         self.current_cluster = None
         self.all_options = False
         self.preview_on = False
+        # Set when the flow changed since the last checkpoint render
+        self._dirty = True
+        # DOT sources last written to the checkpoint and preview files
+        self._checkpoint_source: Optional[str] = None
+        self._preview_source: Optional[str] = None
 
     def add_node(self):
         node_id = click.prompt("Enter node ID")
         self.flow.start(node_id)
-        self.nodes.append(node_id)
+        self.nodes[node_id] = None
         self.current_node = node_id
         click.echo(f"{fg.GREEN}✓{RESET} Added start node: {node_id}")
 
@@ -198,7 +280,7 @@ class InterractiveSession:
         node_id = click.prompt("Enter node ID")
         label = click.prompt("Enter label (optional)", default=node_id)
         self.flow.process(node_id, label)
-        self.nodes.append(node_id)
+        self.nodes[node_id] = None
         self.current_node = node_id
         click.echo(f"{fg.GREEN}✓{RESET} Added process node: {node_id}")
 
@@ -206,14 +288,14 @@ class InterractiveSession:
         node_id = click.prompt("Enter node ID")
         question = click.prompt("Enter question", default=node_id)
         self.flow.decision(node_id, question)
-        self.nodes.append(node_id)
+        self.nodes[node_id] = None
         self.current_node = node_id
         click.echo(f"{fg.GREEN}✓{RESET} Added decision node: {node_id}")
 
     def add_end(self):
         node_id = click.prompt("Enter node ID")
         self.flow.end(node_id)
-        self.nodes.append(node_id)
+        self.nodes[node_id] = None
         self.current_node = node_id
         click.echo(f"{fg.GREEN}✓{RESET} Added end node: {node_id}")
 
@@ -251,16 +333,11 @@ class InterractiveSession:
                 f"{bg.BLACK}Now adding nodes to cluster/subgraph '{bg.GREEN}{fg.DWHITE}{cluster_name}{RESET}'..."
             )
             while self._run_wizard(is_subgraph=True) != 0:
-                node_id = click.prompt("Enter node ID for cluster/subgraph")
-                while not node_id_validator(node_id):
-                    click.echo(
-                        f"{fg.RED}Invalid node id. {fg.MAGENTA}Must start with a letter or underscore{RESET}"
-                    )
-                    node_id = click.prompt(
-                        f"Enter node ID for cluster/subgraph eg({fg.LWHITE}cluster1{RESET})"
-                    )
+                node_id = click.prompt(
+                    "Enter node ID for cluster/subgraph", value_proc=_checked_node_id
+                )
                 self.flow.process(node_id)
-                self.nodes.append(node_id)
+                self.nodes[node_id] = None
                 self.cluster_nodes.append(node_id)
                 self.current_node = node_id
             click.echo(f"{fg.FYELLOW}Exited subgraph{RESET}")
@@ -271,27 +348,34 @@ class InterractiveSession:
         click.echo()
 
     def save_progress(self, echo=True):
-        # Always generate both DOT and PNG
-        dot_exporter = DotExporter()
-        image_exporter = ImageExporter()
-
-        dot_path = Path(f"{self.output.split('.')[0]}_checkpoint").with_suffix(".dot")
-        png_path = Path(f"{self.output.split('.')[0]}_preview").with_suffix(".png")
+        from ..exporters.dot import DotExporter
 
-        dot_exporter.export(self.flow.to_dot(), str(dot_path))
-        image_exporter.export(self.flow.to_dot(), str(png_path))
+        dot_path = self._checkpoint_path
+        dot_source = self.flow.to_dot()
+        # to_dot() hands back the same string until the flow changes
+        if dot_source is not self._checkpoint_source:
+            DotExporter().export(dot_source, str(dot_path))
+            self._checkpoint_source = dot_source
+        self._export_preview(dot_source)
 
         if echo:
             click.echo(f"{fg.GREEN}Progess saved{RESET}:")
             click.echo(f"  - DOT file: {fg.BLUE}{dot_path}{RESET}")
 
-    def preview_diagram(self):
-        # Always generate both DOT and PNG
-        image_exporter = ImageExporter()
+    def _export_preview(self, dot_source: str):
+        """Render the preview PNG unless it already shows this source."""
+        if dot_source is self._preview_source:
+            return
 
-        png_path = Path(f"{self.output.split('.')[0]}_preview").with_suffix(".png")
+        from ..exporters.image import ImageExporter
 
-        image_exporter.export(self.flow.to_dot(), str(png_path))
+        ImageExporter().export(dot_source, str(self._preview_path))
+        self._preview_source = dot_source
+
+    def preview_diagram(self):
+        png_path = self._preview_path
+
+        self._export_preview(self.flow.to_dot())
 
         click.echo(f"{fg.GREEN}Preview saved{RESET}:")
         click.echo(f"  - PNG file: {fg.BLUE}{png_path}{RESET}")
@@ -314,71 +398,55 @@ class InterractiveSession:
         clear_screen()
 
     def show_all_options(self):
-        click.echo("  10. Save Progess")
-        click.echo("  11. Preview diagram")
-        click.echo("  12. View flow")
-        click.echo("  13. Clear Screen")
+        click.echo(_MORE_OPTIONS_MENU)
 
     def _run_wizard(self, is_subgraph=False):
         """Run interactive wizard for building flows."""
 
         while True:
-            try:
-                click.echo(f"{fg.DWHITE}Options:{RESET}")
-
-                if not is_subgraph:
-                    click.echo("  1. Add start node (ellipse)")
-                    click.echo("  2. Add process node (rect)")
-                    click.echo("  3. Add decision node (diamond)")
-                    click.echo("  4. Add end node")
-                    click.echo("  5. Connect nodes")
-                    click.echo(f"  6. Add cluster({fg.LBLUE}subgraph{RESET})")
-                    click.echo("  7. Finish and generate")
-                else:
-                    click.echo("  1. Add subgraph start node (ellipse)")
-                    click.echo("  2. Add subgraph process node (rect)")
-                    click.echo("  3. Add subgraph decision node (diamond)")
-                    click.echo("  4. Add subgraph end node")
-                    click.echo("  5. Connect subgraph nodes")
-                    click.echo(f"  6. Add sub-cluster({fg.LBLUE}sub-subgraph{RESET})")
-                    click.echo("  7. Exit subgraph")
+            click.echo(_SUBGRAPH_MENU if is_subgraph else _TOP_MENU)
 
-                click.echo(f"  8. {fg.LBLUE}More Options{RESET}")
-                click.echo("  9. Exit session")
+            if self.preview_on and self._dirty:
+                if self._attempt(self.save_progress, echo=False):
+                    self._dirty = False
 
-                self.save_progress(echo=False) if self.preview_on else None
+            if self.all_options:
+                self.show_all_options()
 
-                if self.all_options:
-                    self.show_all_options()
+            choice = click.prompt(f"{fg.DWHITE}Choose an option{RESET}", type=int)
 
-                choice = click.prompt(f"{fg.DWHITE}Choose an option{RESET}", type=int)
+            self.all_options = choice == 8
 
-                self.all_options = choice == 8
+            if choice == 7:
+                return 0
 
-                if choice == 7:
-                    return 0
-
-                if choice == 9:
-                    click.echo("\nQuit")
-                    sys.exit(1)
+            if choice == 9:
+                click.echo("\nQuit")
+                sys.exit(1)
 
-                action = self.method_map.get(choice, None)
+            action = (
+                self._dispatch[choice] if 0 <= choice < len(self._dispatch) else None
+            )
 
-                if not action:
-                    if choice != 8:
-                        click.echo(f"{fg.YELLOW} Invalid option{RESET}")
-                    else:
-                        self.clear_screen()
-                    continue
+            if not action:
+                if choice != 8:
+                    click.echo(f"{fg.YELLOW} Invalid option{RESET}")
+                else:
+                    self.clear_screen()
+                continue
 
-                action()
+            # Options 1-6 add nodes, edges or clusters
+            if self._attempt(action) and choice <= 6:
+                self._dirty = True
 
-            except click.ClickException:
-                click.echo("\nQuit")
-                sys.exist(1)
-            except Exception as e:
-                click.echo(f"{fg.RED}Wizard Error: {fg.YELLOW}{e}{RESET}", err=True)
-                continue
+    def _attempt(self, action, **kwargs) -> bool:
+        """Run a wizard action, reporting user-facing errors instead of raising."""
+        try:
+            action(**kwargs)
+        except (DotFlowError, OSError) as e:
+            click.echo(f"{fg.RED}Wizard Error: {fg.YELLOW}{e}{RESET}", err=True)
+            return False
+        return True
 
     def load_file(self):
         """TODO: Implement loading of dot file to resume editing"""
@@ -407,8 +475,7 @@ def validate(dsl_file: click.File):
 
     try:
         flow = DotInterpreter()
-        dsl_content = dsl_file.read()
-        flow.parse_dsl(dsl_content)
+        flow.parse_dsl_stream(dsl_file)
 
         click.echo(f"{fg.GREEN}✓{RESET}DSL syntax is valid!")
         click.echo(f"Found {len(flow.nodes)} nodes and {len(flow.edges)} edges")
@@ -437,46 +504,23 @@ def themes():
     click.echo("")
 
     for theme in Theme:
-        flow = DotInterpreter(theme=theme)
-        flow.start("Sample").process("Node").end("End")
-
-        click.echo(f"  {theme.value:<12} - {_get_theme_description(theme)}")
+        click.echo(
+            f"  {theme.value:<12} - {_THEME_DESCRIPTIONS.get(theme, 'Custom theme')}"
+        )
 
     click.echo("")
     click.echo("Use: dotflow generate --theme THEME_NAME")
 
 
-def _get_theme_description(theme: Theme) -> str:
-    """Get description for a theme."""
-    descriptions = {
-        Theme.DEFAULT: "Clean black and white",
-        Theme.DARK: "Dark mode with light text",
-        Theme.COLORFUL: "Bright yellow nodes",
-        Theme.BLUE: "Blue color scheme",
-        Theme.GREEN: "Green color scheme",
-        Theme.MONOCHROME: "Simple monochrome",
-    }
-    return descriptions.get(theme, "Custom theme")
-
-
 @cli.command()
-@click.option(
-    "--format",
-    "-f",
-    type=click.Choice(["png", "svg", "pdf", "dot"]),
-    default="png",
-    help="Output format",
-)
-@click.option(
-    "--theme",
-    "-t",
-    type=click.Choice([t.value for t in Theme]),
-    default="default",
-    help="Color theme",
-)
+@_format_opt
+@_theme_opt
 def examples(format: str, theme: str):
     """Generate example diagrams."""
 
+    from ..exporters.dot import DotExporter
+    from ..exporters.image import ImageExporter
+
     examples_dir = Path("dotflow_examples")
     examples_dir.mkdir(exist_ok=True)
 
@@ -487,23 +531,44 @@ def examples(format: str, theme: str):
         ("complex_workflow", _create_complex_workflow),
     ]
 
+    # Image examples are rendered together in one Graphviz run
+    pending = []
     for example_name, creator_func in examples_data:
         try:
             flow = DotInterpreter(example_name, Theme(theme))
             creator_func(flow)
 
+            output_path = examples_dir / f"{example_name}.{format}"
+            dot_source = flow.to_dot()
             if format == "dot":
-                output_path = examples_dir / f"{example_name}.dot"
-                DotExporter().export(flow.to_dot(), str(output_path))
+                DotExporter().export(dot_source, str(output_path))
+                click.echo(f"✓ Generated {example_name}: {output_path}")
             else:
-                output_path = examples_dir / f"{example_name}.{format}"
-                ImageExporter().export(flow.to_dot(), str(output_path), format)
-
-            click.echo(f"✓ Generated {example_name}: {output_path}")
+                pending.append((example_name, dot_source, str(output_path)))
 
         except Exception as e:
             click.echo(f"✗ Failed to generate {example_name}: {e}", err=True)
 
+    if pending:
+        exporter = ImageExporter()
+        try:
+            exporter.export_batch(
+                [(dot_source, path) for _, dot_source, path in pending], format
+            )
+        except DotFlowError:
+            # One bad source fails the whole run; retry each on its own so
+            # only the broken examples are reported
+            for example_name, dot_source, output_path in pending:
+                try:
+                    exporter.export(dot_source, output_path, format)
+                except Exception as e:
+                    click.echo(f"✗ Failed to generate {example_name}: {e}", err=True)
+                else:
+                    click.echo(f"✓ Generated {example_name}: {output_path}")
+        else:
+            for example_name, _, output_path in pending:
+                click.echo(f"✓ Generated {example_name}: {output_path}")
+
 
 def _create_simple_flow(flow: DotInterpreter):
     """Create a simple linear flow."""
@@ -520,6 +585,7 @@ def _create_decision_tree(flow: DotInterpreter):
         .decision("Success")
         .process("Error Handling")
         .end("End")
+        .freeze_node_namespace()
         .connect("Start", "Input Data", "Initialize")
         .connect("Input Data", "Valid", "Data In")
         .connect("Valid", "ProcessData", label="Yes")
@@ -542,7 +608,8 @@ def _create_clustered_flow(flow: DotInterpreter):
     with flow.cluster("output", "Output"):
         flow.process("Generate Report").end("Finish")
     (
-        flow.connect("Read Input", "Validate Input")
+        flow.freeze_node_namespace()
+        .connect("Read Input", "Validate Input")
         .connect("Validate Input", "Transform")
         .connect("Transform", "Analyze")
         .connect("Analyze", "Generate Report")
@@ -564,6 +631,7 @@ def _create_complex_workflow(flow: DotInterpreter):
         .decision("Output Valid")
         .process("Save Results")
         .end("End")
+        .freeze_node_namespace()
         .connect("Config Valid", "Read Data", label="Yes")
         .connect("Config Valid", "Init", label="No")
         .connect("Data Available", "End", label="No")
@@ -576,13 +644,7 @@ def _create_complex_workflow(flow: DotInterpreter):
 
 
 @cli.command()
-@click.option(
-    "--format",
-    "-f",
-    type=click.Choice(["png", "svg", "pdf", "dot"]),
-    default="png",
-    help="Output format",
-)
+@_format_opt
 def cheat_sheet(format: str):
     """Generate a DSL cheat sheet diagram."""
 
@@ -607,17 +669,25 @@ def cheat_sheet(format: str):
         y_pos -= 100
 
     output_path = f"dotflow_cheat_sheet.{format}"
+    dot_source = flow.to_dot()
+
+    from ..exporters.dot import DotExporter
+    from ..exporters.image import ImageExporter
 
     try:
         if format == "dot":
-            DotExporter().export(flow.to_dot(), output_path)
+            DotExporter().export(dot_source, output_path)
         else:
-            ImageExporter().export(flow.to_dot(), output_path, format)
+            ImageExporter().export(dot_source, output_path, format)
     except Exception as e:
         sys.exit(f"{fg.RED}{e}{RESET}")
     click.echo(f"{fg.GREEN}✓{fg.GREEN} Generated cheat sheet{RESET}: {output_path}")
 
 
+# Importing this subpackage binds it as dotflow.cli; expose the group there
+# instead, as dotflow.__getattr__ does when the CLI has not been loaded yet
+sys.modules[__package__.partition(".")[0]].cli = cli
+
 if __name__ == "__main__":
     cli()
 
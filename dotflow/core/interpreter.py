@@ -2,9 +2,23 @@
 Main interpreter class that orchestrates all functionality.
 """
 
-from typing import Dict, Union, List, Optional, Any, TYPE_CHECKING
+import sys
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    Union,
+    List,
+    Optional,
+    Any,
+    Tuple,
+    TYPE_CHECKING,
+)
 from contextlib import contextmanager
+from dataclasses import asdict
+from itertools import repeat
 from pathlib import Path
+from types import MappingProxyType
 from .models import (
     Node,
     Edge,
@@ -19,8 +33,6 @@ from ..utils.validators import validate_node_id, validate_label
 from ..utils.exceptions import (
     NodeNotFoundError,
 )
-from ..exporters.dot import DotExporter
-from ..exporters.image import ImageExporter
 from ..core.models import NodeStyle
 
 if TYPE_CHECKING:
@@ -28,10 +40,29 @@ if TYPE_CHECKING:
     from ..api.natural import NaturalLanguageAPI
     from ..api.dsl import TextualDSL
 
+# Lookup tables for the node/edge construction path, built once at import
+_SHAPE_BY_VALUE = {shape.value: shape for shape in NodeShape}
+_EDGE_STYLE_VALUES = frozenset(item.value for item in EdgeStyle)
+_RANKDIR_BY_DIRECTION = {
+    d: d.value.replace('"', "").replace("'", "") for d in Direction
+}
+# Node kind -> (shape, style overrides) for the core node constructors
+_SHAPE_PRESETS = {
+    "start": (NodeShape.ELLIPSE, {}),
+    "process": (NodeShape.RECTANGLE, {}),
+    "decision": (NodeShape.DIAMOND, {}),
+    "end": (NodeShape.ELLIPSE, {"style": "filled", "fillcolor": "#ffcccc"}),
+    "input_output": (NodeShape.PARALLELOGRAM, {}),
+}
+
 
 class DotInterpreter:
     """
     Main interpreter for creating DOT diagrams with multiple API styles.
+
+    to_dot() caches its result until the flow changes through the
+    interpreter's methods. Editing nodes, edges or the Node/Edge objects
+    directly is not tracked; call clear_dot_cache() afterwards.
     """
 
     def __init__(
@@ -47,7 +78,20 @@ class DotInterpreter:
         self.edges: List[Edge] = []
         self.clusters: Dict[str, Cluster] = {}
         self._current_cluster: Optional[str] = None
+        # node_id -> owning cluster name (None for top-level nodes)
+        self._node_owner: Dict[str, Optional[str]] = {}
+        # Snapshot of node ids taken by freeze_node_namespace()
+        self._frozen_node_ids: Optional[frozenset] = None
         self._theme_config = ThemeManager.get_theme_config(theme)
+        # Theme style fields, merged with per-node/edge overrides on creation
+        self._node_style_base = asdict(self._theme_config["node_style"])
+        self._edge_style_base = asdict(self._theme_config["edge_style"])
+        # Shared by every node/edge created without style overrides; styles
+        # are frozen, so the theme's own instance can be reused as-is
+        self._default_node_style = self._theme_config["node_style"]
+        self._default_edge_style = EdgeStyleConfig(
+            **{**self._edge_style_base, "style": "", "arrowhead": "arrow"}
+        )
         # API instances (lazy-loaded)
         self._pythonic_api: Optional["PythonicAPI"] = None
         self._natural_api: Optional["NaturalLanguageAPI"] = None
@@ -57,10 +101,13 @@ class DotInterpreter:
         self._last_node: Optional[str] = None
         self._pending_label: Optional[str] = None
 
+        # Rendered DOT source; None whenever the graph changed since to_dot()
+        self._dot_cache: Optional[str] = None
+
         # Initialize default graph attributes
         self._graph_attrs = {
             "bgcolor": self._theme_config["bg_color"],
-            "rankdir": direction.value.replace('"', "").replace("'", ""),
+            "rankdir": _RANKDIR_BY_DIRECTION[direction],
         }
 
     @property
@@ -112,33 +159,42 @@ class DotInterpreter:
         """Override // for dashed connections: flow >> "A" // "B" """
         return self.nl.__divmod__(other)
 
+    def build(self, ops: Iterable[Tuple[str, str]]) -> "DotInterpreter":
+        """Apply natural language operations in bulk: [("node", "A"), ...]"""
+        self.nl.build(ops)
+        return self
+
     # Textual DSL methods
     def parse_dsl(self, dsl_text: str) -> "DotInterpreter":
         """Parse DSL text (convenience method)."""
         return self.dsl.parse_dsl(dsl_text)
 
+    def parse_dsl_stream(self, lines_iter: Iterable[str]) -> "DotInterpreter":
+        """Parse DSL lines from any iterable, such as an open file."""
+        return self.dsl.parse_dsl_stream(lines_iter)
+
     def _create_node(
         self, node_id: str, label: str, shape: NodeShape, **kwargs
     ) -> Node:
         """Create a node with theme-appropriate styling."""
         # Remove whitespaces
-        node_id = node_id.replace(" ", "")
-        # Validate id and label
+        if " " in node_id:
+            node_id = node_id.replace(" ", "")
         validate_node_id(node_id)
         validate_label(label)
+        # Ids are dict keys in several places; share one string object
+        node_id = sys.intern(node_id)
 
         # Merge theme style with any custom styles
-        theme_style = self._theme_config["node_style"]
-        custom_style = theme_style.__dict__.copy()
-        custom_style.update(kwargs)
-
-        style = NodeStyle(**custom_style)
+        if kwargs:
+            style = NodeStyle(**{**self._node_style_base, **kwargs})
+        else:
+            style = self._default_node_style
 
         # Endure that shape is isinstance of NodeShape
         if not isinstance(shape, NodeShape):
             shape = "rect" if shape == "rectangle" else shape
-            reverse_map = {ln.value: ln for ln in NodeShape}
-            shape = reverse_map.get(shape, None)
+            shape = _SHAPE_BY_VALUE.get(shape, None)
 
             if not shape:
                 if shape is None:
@@ -153,9 +209,13 @@ class DotInterpreter:
 
         if self._current_cluster and self._current_cluster in self.clusters:
             self.clusters[self._current_cluster].add_node(node)
+            self._node_owner[node_id] = self._current_cluster
         else:
             self.nodes[node_id] = node
+            self._node_owner[node_id] = None
 
+        self._frozen_node_ids = None
+        self._dot_cache = None
         return node
 
     def _create_edge(
@@ -170,46 +230,109 @@ class DotInterpreter:
     ) -> Edge:
         """Create an edge with theme-appropriate styling."""
         # remove whitespaces
-        from_node = from_node.replace(" ", "")
-        to_node = to_node.replace(" ", "")
+        if " " in from_node:
+            from_node = from_node.replace(" ", "")
+        if " " in to_node:
+            to_node = to_node.replace(" ", "")
         # Validate nodes exist
-        if from_node not in self.nodes and not any(
-            from_node in [node.id for node in cluster.nodes]
-            for cluster in self.clusters.values()
-        ):
+        known_ids = self._frozen_node_ids or self._node_owner
+        if from_node not in known_ids:
             raise NodeNotFoundError(f"Source node '{from_node}' not found")
 
-        if to_node not in self.nodes and not any(
-            to_node in [node.id for node in cluster.nodes]
-            for cluster in self.clusters.values()
-        ):
+        if to_node not in known_ids:
             raise NodeNotFoundError(f"Target node '{to_node}' not found")
 
         if label:
             validate_label(label)
 
+        edge_style = self._edge_style(style, arrowhead, arrowtail, **kwargs)
+        edge = Edge(from_node, to_node, label, edge_style)
+
+        if self._current_cluster and self._current_cluster in self.clusters:
+            self.clusters[self._current_cluster].add_edge(edge)
+        else:
+            self.edges.append(edge)
+
+        self._dot_cache = None
+        return edge
+
+    def _edge_style(
+        self,
+        style: EdgeStyle = EdgeStyle.SOLID,
+        arrowhead: str = "arrow",
+        arrowtail: str = None,
+        **kwargs,
+    ) -> EdgeStyleConfig:
+        """Merge the theme edge style with arrow and custom styles."""
+        if style not in _EDGE_STYLE_VALUES:
+            style = ""
+
+        if not (style or arrowtail or kwargs) and arrowhead == "arrow":
+            return self._default_edge_style
+
         # Add arrow styles
         kwargs["arrowhead"] = arrowhead
         if arrowtail:
             kwargs["arrowtail"] = arrowtail
 
-        if style not in [item.value for item in EdgeStyle]:
-            style = ""
-
         # Merge theme style with any custom styles
-        theme_style = self._theme_config["edge_style"]
-        custom_style = theme_style.__dict__.copy()
-        custom_style.update({"style": style, **kwargs})
+        return EdgeStyleConfig(**{**self._edge_style_base, "style": style, **kwargs})
 
-        edge_style = EdgeStyleConfig(**custom_style)
-        edge = Edge(from_node, to_node, label, edge_style)
+    def connect_many(
+        self, edges: Iterable[Tuple[str, str, Optional[str], EdgeStyle]]
+    ) -> "DotInterpreter":
+        """
+        Connect several node pairs at once.
+
+        Takes (from_node, to_node, label, style) tuples. Every endpoint is
+        checked before any edge is added, so a missing node leaves the flow
+        unchanged.
+        """
+        pending = [
+            (from_node.replace(" ", ""), to_node.replace(" ", ""), label, style)
+            for from_node, to_node, label, style in edges
+        ]
+        if not pending:
+            return self
+
+        known_ids = self._frozen_node_ids or self._node_owner
+        for from_node, to_node, label, _ in pending:
+            if from_node not in known_ids:
+                raise NodeNotFoundError(f"Source node '{from_node}' not found")
+            if to_node not in known_ids:
+                raise NodeNotFoundError(f"Target node '{to_node}' not found")
+            if label:
+                validate_label(label)
+
+        new_edges = [
+            Edge(from_node, to_node, label, self._edge_style(style))
+            for from_node, to_node, label, style in pending
+        ]
 
         if self._current_cluster and self._current_cluster in self.clusters:
-            self.clusters[self._current_cluster].add_edge(edge)
+            cluster = self.clusters[self._current_cluster]
+            for edge in new_edges:
+                cluster.add_edge(edge)
         else:
-            self.edges.append(edge)
+            self.edges.extend(new_edges)
 
-        return edge
+        self._dot_cache = None
+        return self
+
+    def has_node(self, node_id: str) -> bool:
+        """Whether an edge may use node_id as an endpoint."""
+        return node_id in (self._frozen_node_ids or self._node_owner)
+
+    def freeze_node_namespace(self) -> "DotInterpreter":
+        """
+        Snapshot the current node ids for the edge-building phase.
+
+        Useful when all nodes are defined before any connections: edge
+        endpoint checks then run against a frozenset. Adding another node
+        drops the snapshot again.
+        """
+        self._frozen_node_ids = frozenset(self._node_owner)
+        return self
 
     def node(self, *args, **kwargs):
         return self._create_node(*args, **kwargs)
@@ -218,43 +341,39 @@ class DotInterpreter:
         return self._create_edge(*args, **kwargs)
 
     # Core API methods
+    def _preset(
+        self, kind: str, node_id: str, label: Optional[str] = None
+    ) -> "DotInterpreter":
+        """Create a node of a preset kind from _SHAPE_PRESETS."""
+        shape, overrides = _SHAPE_PRESETS[kind]
+        self._create_node(node_id, label or node_id, shape, **overrides)
+        return self
+
     def start(self, node_id: str, label: Optional[str] = None) -> "DotInterpreter":
         """Start a flow with an initial node (ellipse shape)."""
-        label = label or node_id
-        self._create_node(node_id, label, NodeShape.ELLIPSE)
-        return self
+        return self._preset("start", node_id, label)
 
     def process(self, node_id: str, label: Optional[str] = None) -> "DotInterpreter":
         """Create a process node (rectangle shape)."""
-        label = label or node_id
-        self._create_node(node_id, label, NodeShape.RECTANGLE)
-        return self
+        return self._preset("process", node_id, label)
 
     def decision(
         self, node_id: str, question: Optional[str] = None
     ) -> "DotInterpreter":
         """Create a decision node (diamond shape)."""
-        label = question or node_id
-        self._create_node(node_id, label, NodeShape.DIAMOND)
-        return self
+        return self._preset("decision", node_id, question)
 
     def end(self, node_id: str, label: Optional[str] = None) -> "DotInterpreter":
         """Create an end node (ellipse shape)."""
-        label = label or node_id
-        self._create_node(
-            node_id, label, NodeShape.ELLIPSE, style="filled", fillcolor="#ffcccc"
-        )
-        return self
+        return self._preset("end", node_id, label)
 
     def input_output(
         self, node_id: str, label: Optional[str] = None
     ) -> "DotInterpreter":
         """Create an input/output node (parallelogram shape)."""
-        label = label or node_id
-        self._create_node(node_id, label, NodeShape.PARALLELOGRAM)
-        return self
+        return self._preset("input_output", node_id, label)
 
-    def connect(
+    def link(
         self,
         from_node: str | Node,
         to_node: str,
@@ -263,18 +382,44 @@ class DotInterpreter:
         arrowtail: str = None,
         style: EdgeStyle = EdgeStyle.SOLID,
         **kwargs,
-    ) -> "DotInterpreter":
-        """Connect two nodes with an optional label."""
+    ) -> Edge:
+        """Connect two nodes like connect(), returning the new edge."""
         if isinstance(from_node, Node) and hasattr(from_node, "id"):
             from_node = from_node.id
         if isinstance(to_node, Node) and hasattr(to_node, "id"):
             to_node = to_node.id
 
-        self._create_edge(
-            from_node, to_node, label, arrowhead, arrowtail, style, **kwargs
+        return self._create_edge(
+            from_node,
+            to_node,
+            label,
+            style=style,
+            arrowhead=arrowhead,
+            arrowtail=arrowtail,
+            **kwargs,
         )
+
+    def connect(
+        self,
+        from_node: str | Node,
+        to_node: str,
+        label: Optional[str] = None,
+        arrowhead: str = "arrow",
+        arrowtail: str = None,
+        style: EdgeStyle = EdgeStyle.SOLID,
+        **kwargs,
+    ) -> "DotInterpreter":
+        """Connect two nodes with an optional label."""
+        self.link(from_node, to_node, label, arrowhead, arrowtail, style, **kwargs)
         return self
 
+    def relabel_edge(self, edge: Edge, label: str) -> Edge:
+        """Change the label of an existing edge."""
+        validate_label(label)
+        edge.label = label
+        self._dot_cache = None
+        return edge
+
     @contextmanager
     def cluster(self, name: str, label: str, **style_kwargs):
         """Context manager for creating clusters."""
@@ -288,60 +433,128 @@ class DotInterpreter:
             "gradientangle": "90",
             **style_kwargs,
         }
+        replaced = self.clusters.get(name)
+        if replaced is not None:
+            # The old cluster's nodes go away with it
+            for node_id in replaced.nodes:
+                if self._node_owner.get(node_id) == name:
+                    del self._node_owner[node_id]
+            self._frozen_node_ids = None
         self.clusters[name] = Cluster(name, label, cluster_style)
+        self._dot_cache = None
 
         try:
             yield self
         finally:
             self._current_cluster = previous_cluster
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        self._dot_cache = None
+
+    def clear_dot_cache(self):
+        """Drop the cached DOT source after editing the graph directly."""
+        self._dot_cache = None
+
     def set_graph_attr(self, key: str, value: Any):
         """Set a graph-level attribute."""
         self._graph_attrs[key] = value
+        self._dot_cache = None
 
     def to_dot(self) -> str:
-        """Generate DOT language code."""
-        lines = [f"digraph {self.name} {{"]
+        """Generate DOT language code, reusing the last render if unchanged."""
+        if self._dot_cache is None:
+            self._dot_cache = "".join(self.iter_dot())
+        return self._dot_cache
+
+    def iter_dot(self) -> Iterator[str]:
+        """Yield the DOT source piece by piece, one statement per line."""
+        if self._dot_cache is not None:
+            yield self._dot_cache
+            return
+
+        yield f"digraph {self.name} {{\n"
 
         # Add graph attributes
         for key, value in self._graph_attrs.items():
-            lines.append(f'  {key}="{value}";')
-
-        lines.append('  node [fontname="Arial", fontsize=12];')
-        lines.append('  edge [fontname="Arial", fontsize=10];')
-        lines.append("")
+            yield f'  {key}="{value}";\n'
+
+        # Theme styles become graph-wide defaults; nodes and edges then only
+        # carry the attributes they override
+        node_defaults = self._default_node_style
+        edge_defaults = self._default_edge_style
+        node_attrs = ", ".join(node_defaults.dot_attrs())
+        edge_attrs = ", ".join(edge_defaults.dot_attrs())
+        yield f"  node [{node_attrs}];\n"
+        yield (
+            f'  edge [fontname="Arial", {edge_attrs}, '
+            f'arrowhead="{edge_defaults.arrowhead}"];\n'
+        )
+        yield "\n"
 
         # Add nodes
-        for node in self.nodes.values():
-            lines.append(f"  {node.to_dot()}")
+        for line in map(Node.to_dot, self.nodes.values(), repeat(node_defaults)):
+            yield f"  {line}\n"
 
         # Add edges
-        for edge in self.edges:
-            lines.append(f"  {edge.to_dot()}")
+        for line in map(Edge.to_dot, self.edges, repeat(edge_defaults)):
+            yield f"  {line}\n"
 
         # Add clusters
         for cluster in self.clusters.values():
-            lines.extend([f"  {line}" for line in cluster.to_dot()])
+            for line in cluster.to_dot(node_defaults, edge_defaults):
+                yield f"  {line}\n"
 
-        lines.append("}")
-        return "\n".join(lines)
+        yield "}"
 
     def get_cluster(self):
-        """Returns cached clusters for the active instance"""
-        return self.clusters
+        """Returns a read-only view of the clusters for the active instance"""
+        return MappingProxyType(self.clusters)
 
     def get_nodes(self):
-        """Returns cached nodes for the active instance"""
-        return self.nodes
+        """Returns a read-only view of the nodes for the active instance"""
+        return MappingProxyType(self.nodes)
 
     def render(self, format: str, output):
         output_path = Path(f"{output.split('.', 1)[0]}.{format}")
 
         if format == "dot":
-            DotExporter().export(self.to_dot(), str(output_path))
+            from ..exporters.dot import DotExporter
+
+            DotExporter().export_stream(self, str(output_path))
         else:
+            from ..exporters.image import ImageExporter
+
             ImageExporter().export(self.to_dot(), str(output_path), format)
 
+    def render_many(self, formats: Iterable[str], output) -> List[Path]:
+        """
+        Render the flow to several formats sharing one base name.
+
+        Image formats are produced by a single Graphviz run; "dot" is
+        written directly.
+        """
+        base = output.split(".", 1)[0]
+        paths = [Path(f"{base}.{format}") for format in formats]
+        images = [str(path) for path in paths if path.suffix != ".dot"]
+        # Serialized once and shared by every output
+        dot_source = self.to_dot()
+
+        if len(images) < len(paths):
+            from ..exporters.dot import DotExporter
+
+            DotExporter().export(dot_source, f"{base}.dot")
+        if images:
+            from ..exporters.image import ImageExporter
+
+            ImageExporter().export_formats(dot_source, images)
+        return paths
+
     def __str__(self) -> str:
         return self.to_dot()
 
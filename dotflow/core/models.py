@@ -3,8 +3,8 @@ Data models for DOT elements.
 """
 
 from enum import Enum
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 import html
 
 
@@ -34,7 +34,7 @@ class Direction(Enum):
     BOTTOM_UP = "BT"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NodeStyle:
     color: str = "black"
     fillcolor: str = "white"
@@ -45,8 +45,12 @@ class NodeStyle:
     width: float = 0.75
     height: float = 0.5
 
+    def dot_attrs(self, defaults: Optional["NodeStyle"] = None) -> List[str]:
+        """DOT attributes for the fields that differ from defaults."""
+        return _dot_attrs(self, defaults, _NODE_STYLE_ATTRS)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EdgeStyleConfig:
     color: str = "black"
     fontcolor: str = "black"
@@ -55,6 +59,45 @@ class EdgeStyleConfig:
     arrowtail: str = None
     style: EdgeStyle = EdgeStyle.SOLID
 
+    def dot_attrs(self, defaults: Optional["EdgeStyleConfig"] = None) -> List[str]:
+        """DOT attributes for the fields that differ from defaults."""
+        return _dot_attrs(self, defaults, _EDGE_STYLE_ATTRS)
+
+
+# (field, quoted) pairs emitted by the style dot_attrs() methods
+_NODE_STYLE_ATTRS = (
+    ("color", True),
+    ("fillcolor", True),
+    ("fontcolor", True),
+    ("fontsize", False),
+    ("fontname", True),
+    ("style", True),
+    ("width", False),
+    ("height", False),
+)
+_EDGE_STYLE_ATTRS = (("color", True), ("fontcolor", True), ("fontsize", False))
+
+
+def _dot_attrs(style, defaults, fields) -> List[str]:
+    if style is defaults:
+        return []
+    attrs = []
+    for name, quoted in fields:
+        value = getattr(style, name)
+        if defaults is not None and value == getattr(defaults, name):
+            continue
+        attrs.append(f'{name}="{value}"' if quoted else f"{name}={value}")
+    return attrs
+
+
+def _escaped_label(item) -> str:
+    """HTML-escaped label of a Node/Edge, recomputed only if it was relabelled."""
+    label, escaped = item._escaped
+    if label is not item.label:
+        escaped = html.escape(item.label) if item.label else ""
+        item._escaped = (item.label, escaped)
+    return escaped
+
 
 @dataclass
 class Node:
@@ -62,21 +105,22 @@ class Node:
     label: str
     shape: NodeShape
     style: NodeStyle
+    # (label, escaped label), filled once so renders skip html.escape
+    _escaped: Tuple[str, str] = field(init=False, repr=False, compare=False)
 
-    def to_dot(self) -> str:
-        attrs = [
-            f'label="{html.escape(self.label)}"',
-            f"shape={self.shape.value}",
-            f'color="{self.style.color}"',
-            f'fillcolor="{self.style.fillcolor}"',
-            f'fontcolor="{self.style.fontcolor}"',
-            f"fontsize={self.style.fontsize}",
-            f'fontname="{self.style.fontname}"',
-            f'style="{self.style.style}"',
-            f"width={self.style.width}",
-            f"height={self.style.height}",
-        ]
-        return f"{self.id} [{', '.join(attrs).strip(',')}];"
+    def __post_init__(self):
+        self._escaped = (self.label, html.escape(self.label))
+
+    def to_dot(self, defaults: Optional[NodeStyle] = None) -> str:
+        """
+        Node statement.
+
+        With defaults (the graph's node [...] statement), style fields equal
+        to them are left out; without, every style field is written.
+        """
+        attrs = [f'label="{_escaped_label(self)}"', f"shape={self.shape.value}"]
+        attrs += self.style.dot_attrs(defaults)
+        return f"{self.id} [{', '.join(attrs)}];"
 
 
 @dataclass
@@ -87,40 +131,44 @@ class Edge:
     style: EdgeStyleConfig = None
     arrowhead: str = "arrow"
     arrowtail: str = None
+    # (label, escaped label), filled once so renders skip html.escape
+    _escaped: Tuple[Optional[str], str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.style is None:
             self.style = EdgeStyleConfig()
-
-    def to_dot(self) -> str:
-        attrs = [
-            f"style={self.style.style.value}"
-            if self.style.style
-            and self.style.style.strip()
-            and hasattr(self.style.style, "value")
-            else ""
-        ]
+        self._escaped = (self.label, html.escape(self.label) if self.label else "")
+
+    def to_dot(self, defaults: Optional[EdgeStyleConfig] = None) -> str:
+        """
+        Edge statement.
+
+        With defaults (the graph's edge [...] statement), style fields equal
+        to them are left out; without, every style field is written.
+        """
+        style = self.style
+        attrs = []
+        if isinstance(style.style, EdgeStyle):
+            attrs.append(f"style={style.style.value}")
         if self.label:
-            attrs.append(f'label="{html.escape(self.label)}"')
-        if self.arrowhead:
+            attrs.append(f'label="{_escaped_label(self)}"')
+        if self.arrowhead and (
+            defaults is None or self.arrowhead != defaults.arrowhead
+        ):
             attrs.append(f'arrowhead="{self.arrowhead}"')
         if self.arrowtail:
             attrs.append(f'arrowtail="{self.arrowtail}"')
-        attrs.extend(
-            [
-                f'color="{self.style.color}"',
-                f'fontcolor="{self.style.fontcolor}"',
-                f"fontsize={self.style.fontsize}",
-            ]
-        )
-        return f"{self.from_node} -> {self.to_node} [{', '.join(attrs).strip(',')}];"
+        attrs += style.dot_attrs(defaults)
+        if not attrs:
+            return f"{self.from_node} -> {self.to_node};"
+        return f"{self.from_node} -> {self.to_node} [{', '.join(attrs)}];"
 
 
 class Cluster:
     def __init__(self, name: str, label: str, style: Optional[Dict[str, Any]] = None):
         self.name = f"cluster_{name}"
         self.label = label
-        self.nodes: List[Node] = []
+        self.nodes: Dict[str, Node] = {}
         self.edges: List[Edge] = []
         self.style = style or {
             "style": "filled",
@@ -130,20 +178,24 @@ class Cluster:
         }
 
     def add_node(self, node: Node):
-        self.nodes.append(node)
+        self.nodes[node.id] = node
 
     def add_edge(self, edge: Edge):
         self.edges.append(edge)
 
-    def to_dot(self) -> List[str]:
+    def to_dot(
+        self,
+        node_defaults: Optional[NodeStyle] = None,
+        edge_defaults: Optional[EdgeStyleConfig] = None,
+    ) -> List[str]:
         lines = [f"subgraph {self.name} {{"]
         lines.append(f'  label="{self.label}";')
         for key, value in self.style.items():
             lines.append(f'  {key}="{value}";')
 
-        for node in self.nodes:
-            lines.append(f"  {node.to_dot()}")
+        for node in self.nodes.values():
+            lines.append(f"  {node.to_dot(node_defaults)}")
         for edge in self.edges:
-            lines.append(f"  {edge.to_dot()}")
+            lines.append(f"  {edge.to_dot(edge_defaults)}")
         lines.append("}")
         return lines
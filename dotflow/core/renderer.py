@@ -1,144 +1,297 @@
 # Simple DOT interpreter + force-directed layout + SVG renderer
-# This script is self-contained and uses only Python standard libraries.
+# Beyond the standard library it needs NumPy (the "render" extra); Numba is
+# used when installed (the "jit" extra).
 # It supports a small DOT subset: graph/digraph, node IDs, edges like A -> B or A -- B,
 # simple attributes in brackets (label="...", color=...), and node/edge statements.
 #
-# Run and it will produce /mnt/data/output_graph.svg which you can download.
+# Run it as a script to produce ~/Documents/output_graph.svg.
 import os
-from math import sqrt, cos, sin, pi
-import random
 import re
+from itertools import chain
+from math import sqrt, cos, sin, pi
 from xml.sax.saxutils import escape
 
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "dotflow.core.renderer needs NumPy; install it with "
+        "'pip install dotflow[render]'"
+    ) from exc
+
+try:  # optional: JIT kernel for the layout on large graphs
+    import numba
+except ImportError:
+    numba = None
+
 
 # ------------------ Parser ------------------
-def parse_dot(dot_text):
-    dot_text = re.sub(r"//.*", "", dot_text)  # strip single-line comments
-    dot_text = re.sub(r"/\*.*?\*/", "", dot_text, flags=re.S)  # strip block comments
-    header = re.match(
-        r'\s*(strict\s+)?(digraph|graph)\s+([\w"-]+)?\s*\{', dot_text, flags=re.I
+# One alternation scanned left to right with no backtracking between
+# tokens; each match also swallows leading whitespace and comments (//, /* */
+# and preprocessor-style lines starting with #), so the pass is linear.
+_TOKEN_RE = re.compile(
+    r"""
+    (?:\s*(?://[^\n]*|/\*.*?(?:\*/|\Z)|^[ \t]*\#[^\n]*))*\s*
+    (?:
+        (?P<ARROW>->|--)
+        |(?P<STRING>"(?:[^"\\]|\\.)*"?|'(?:[^'\\]|\\.)*'?)
+        |(?P<ID>-?[\w.]+)
+        |(?P<HTML><)
+        |(?P<PUNCT>[\[\]{}=,;:])
+        |(?P<OTHER>.)
+        |\Z
     )
-    directed = False
-    if header:
-        directed = header.group(2).lower() == "digraph"
-    # Extract body inside outermost braces
-    body_match = re.search(r"\{(.*)\}\s*$", dot_text, flags=re.S)
-    body = body_match.group(1) if body_match else dot_text
-    # Tokenize by semicolons (not perfect but fine for simple DOT)
-    statements = [s.strip() for s in re.split(r";\s*(?![^[]*\])", body) if s.strip()]
+    """,
+    re.M | re.S | re.X,
+)
+# Plain key=value lists (no escapes, ports or HTML) are common enough to
+# skip the tokenizer for
+_PLAIN_ATTRS_RE = re.compile(
+    r"""[\s,;]*(?:-?[\w.]+\s*=\s*(?:"[^"\\]*"|'[^'\\]*'|-?[\w.]+(?![\w.]))[\s,;]*)*"""
+)
+_ATTR_RE = re.compile(r"""(-?[\w.]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|(-?[\w.]+))""")
+_VALUE = frozenset(("ID", "STRING"))
+_EOF = ("EOF", "")
+
+
+def _tokenize(text):
+    # Yields (kind, value) pairs. Kind is ID, STRING or ARROW, or the
+    # punctuation character itself ("[", "=", ";", ...).
+    pos = 0
+    n = len(text)
+    while pos < n:
+        for m in _TOKEN_RE.finditer(text, pos):
+            kind = m.lastgroup
+            if kind == "ID" or kind == "ARROW":
+                yield (kind, m.group(kind))
+            elif kind == "PUNCT":
+                value = m.group(kind)
+                yield (value, value)
+            elif kind == "STRING":
+                # strip the quotes; an escaped quote becomes a literal one
+                value = m.group(kind)
+                quote = value[0]
+                if len(value) > 1 and value[-1] == quote:
+                    value = value[1:-1]
+                else:
+                    value = value[1:]
+                yield ("STRING", value.replace("\\" + quote, quote))
+            elif kind == "HTML":
+                # HTML-like label: balanced angle brackets, scanned by hand
+                depth = 0
+                end = m.start(kind)
+                while end < n:
+                    if text[end] == "<":
+                        depth += 1
+                    elif text[end] == ">":
+                        depth -= 1
+                        if depth == 0:
+                            break
+                    end += 1
+                yield ("STRING", text[m.end(kind) : end])
+                pos = end + 1
+                break
+        else:
+            return
+
+
+def _parse_attr_list(tokens, i):
+    # Consume one or more [k=v, ...] lists starting at tokens[i]
+    attrs = {}
+    while tokens[i][0] == "[":
+        i += 1
+        kind = tokens[i][0]
+        while kind != "]" and kind != "EOF":
+            if (
+                kind in _VALUE
+                and tokens[i + 1][0] == "="
+                and tokens[i + 2][0] in _VALUE
+            ):
+                attrs[tokens[i][1]] = tokens[i + 2][1]
+                i += 3
+            else:
+                i += 1  # separators and bare keys
+            kind = tokens[i][0]
+        if kind == "]":
+            i += 1
+    return attrs, i
+
+
+def parse_dot(dot_text):
+    # tokens are padded so two tokens of lookahead never run off the end
+    tokens = list(_tokenize(dot_text))
+    end = len(tokens)
+    tokens += (_EOF, _EOF)
     nodes = {}
     edges = []
-    for stmt in statements:
-        # Edge: A -> B  or A -- B (with optional attributes)
-        m = re.match(
-            r"(?P<src>[^->\[\;]+?)(\s*(->|--)\s*)(?P<dst>[^;\[]+)(\s*\[(?P<attr>[^\]]*)\])?",
-            stmt,
-        )
-        if m:
-            src = m.group("src").strip().strip('"')
-            dst = m.group("dst").strip().strip('"')
-            attr = parse_attrs(m.group("attr") or "")
-            nodes.setdefault(src, {})
-            nodes.setdefault(dst, {})
-            edges.append({"src": src, "dst": dst, "attr": attr})
+    directed = False
+    i = 0
+    if tokens[i][0] == "ID" and tokens[i][1].lower() == "strict":
+        i += 1
+    if tokens[i][0] == "ID" and tokens[i][1].lower() in ("graph", "digraph"):
+        directed = tokens[i][1].lower() == "digraph"
+        i += 2 if tokens[i + 1][0] in _VALUE else 1
+    while i < end:
+        kind, value = tokens[i]
+        if kind not in _VALUE:
+            # separators, stray tokens and braces; subgraphs are flattened
+            i += 1
+            continue
+        keyword = value.lower() if kind == "ID" else None
+        following = tokens[i + 1][0]
+        if keyword == "subgraph":
+            i += 2 if following in _VALUE else 1
             continue
-        # Node with attributes: A [label="Hi"]
-        m2 = re.match(r"(?P<id>[^ \t\[]+)\s*\[(?P<attr>[^\]]*)\]", stmt)
-        if m2:
-            nid = m2.group("id").strip().strip('"')
-            attr = parse_attrs(m2.group("attr") or "")
-            nodes.setdefault(nid, {}).update(attr)
+        # graph attribute: key=value
+        if following == "=":
+            i += 3 if tokens[i + 2][0] in _VALUE else 2
             continue
-        # Node alone: A
-        m3 = re.match(r'^[\w"\-\.]+$', stmt)
-        if m3:
-            nid = stmt.strip().strip('"')
-            nodes.setdefault(nid, {})
+        # default attribute statements: node [...], edge [...], graph [...]
+        if following == "[" and keyword in ("node", "edge", "graph"):
+            i = _parse_attr_list(tokens, i + 1)[1]
             continue
-        # fallback: try to parse any id tokens
-        tokens = re.findall(r"[\w\-\.]+", stmt)
-        for t in tokens[:1]:
-            nodes.setdefault(t, {})
+        # node or edge chain: A [-> B ...] [attrs]
+        ids = [value]
+        i += 1
+        while True:
+            # drop port/compass suffixes: A:port:n
+            while tokens[i][0] == ":" and tokens[i + 1][0] in _VALUE:
+                i += 2
+            if tokens[i][0] != "ARROW" or tokens[i + 1][0] not in _VALUE:
+                break
+            ids.append(tokens[i + 1][1])
+            i += 2
+        attrs, i = _parse_attr_list(tokens, i)
+        if len(ids) == 1:
+            nodes.setdefault(value, {}).update(attrs)
+            continue
+        # A -> B -> C becomes A->B and B->C, each with the statement's attrs
+        for src, dst in zip(ids, ids[1:]):
+            nodes.setdefault(src, {})
+            nodes.setdefault(dst, {})
+            edges.append({"src": src, "dst": dst, "attr": dict(attrs)})
     return {"directed": directed, "nodes": nodes, "edges": edges}
 
 
 def parse_attrs(attr_text):
-    attrs = {}
-    # split on commas but allow commas inside quotes
-    parts = re.findall(r'(\w+)\s*=\s*("[^"]*"|\'[^\']*\'|[^,]+)', attr_text)
-    for k, v in parts:
-        v = v.strip()
-        if (v.startswith('"') and v.endswith('"')) or (
-            v.startswith("'") and v.endswith("'")
-        ):
-            v = v[1:-1]
-        attrs[k.strip()] = v
-    return attrs
+    # attr_text is the inside of a [...] list
+    if _PLAIN_ATTRS_RE.fullmatch(attr_text):
+        return {k: a or b or c for k, a, b, c in _ATTR_RE.findall(attr_text)}
+    tokens = list(_tokenize(f"[{attr_text}]"))
+    tokens += (_EOF, _EOF)
+    return _parse_attr_list(tokens, 0)[0]
 
 
 # ------------------ Simple Force-Directed Layout ------------------
+if numba is not None:
+
+    @numba.njit(parallel=True)
+    def _fd_step(pos, indptr, indices, k, t, width, height, margin):
+        # One layout iteration; adjacency is CSR (indptr/indices)
+        n = pos.shape[0]
+        new_pos = np.empty_like(pos)
+        for v in numba.prange(n):
+            xv = pos[v, 0]
+            yv = pos[v, 1]
+            disp_x = 0.0
+            disp_y = 0.0
+            # repulsive
+            for u in range(n):
+                if u == v:
+                    continue
+                dx = xv - pos[u, 0]
+                dy = yv - pos[u, 1]
+                dist = sqrt(dx * dx + dy * dy) + 1e-9
+                force = (k * k) / dist
+                disp_x += (dx / dist) * force
+                disp_y += (dy / dist) * force
+            # attractive (edges)
+            for p in range(indptr[v], indptr[v + 1]):
+                u = indices[p]
+                dx = xv - pos[u, 0]
+                dy = yv - pos[u, 1]
+                dist = sqrt(dx * dx + dy * dy) + 1e-9
+                force = (dist * dist) / k
+                disp_x -= (dx / dist) * force
+                disp_y -= (dy / dist) * force
+            # limit max displacement by temperature and apply
+            disp_len = sqrt(disp_x * disp_x + disp_y * disp_y)
+            x, y = xv, yv
+            if disp_len > 1e-9:
+                x += (disp_x / disp_len) * min(disp_len, t)
+                y += (disp_y / disp_len) * min(disp_len, t)
+            new_pos[v, 0] = min(width - margin, max(margin, x))
+            new_pos[v, 1] = min(height - margin, max(margin, y))
+        return new_pos
+
+
 def layout_force_directed(nodes, edges, width=1200, height=800, iterations=500):
     # nodes: dict of id -> attr
     # edges: list of {'src','dst'}
     n = len(nodes)
     if n == 0:
         return {}
-    # initial positions random in box
-    positions = {
-        nid: (random.uniform(50, width - 50), random.uniform(50, height - 50))
-        for nid in nodes
-    }
-    disp = {nid: [0.0, 0.0] for nid in nodes}
+    ids = list(nodes)
+    index = {nid: i for i, nid in enumerate(ids)}
+    # initial positions random in box, one row per node
+    pos = np.column_stack(
+        (
+            np.random.uniform(50, width - 50, n),
+            np.random.uniform(50, height - 50, n),
+        )
+    )
     area = width * height
     k = sqrt(area / n)
     # constants
     t = max(width, height) / 10.0  # initial "temperature"
     dt = t / (iterations + 1.0)
-    # adjacency for attractive forces
-    adj = {nid: set() for nid in nodes}
-    for e in edges:
-        adj[e["src"]].add(e["dst"])
-        adj[e["dst"]].add(e["src"])
+    margin = 40
+    # adjacency in CSR form: the neighbours of v are
+    # indices[indptr[v]:indptr[v + 1]], each undirected pair counted once
+    ends = np.array(
+        [(index[e["src"]], index[e["dst"]]) for e in edges], dtype=np.intp
+    ).reshape(-1, 2)
+    keys = np.unique(
+        np.concatenate((ends[:, 0] * n + ends[:, 1], ends[:, 1] * n + ends[:, 0]))
+    )
+    src, indices = np.divmod(keys, n)
+    indptr = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+    if numba is not None:
+        for iter_count in range(iterations):
+            pos = _fd_step(pos, indptr, indices, k, t, width, height, margin)
+            t -= dt
+        return {nid: (x, y) for nid, (x, y) in zip(ids, pos.tolist())}
+    # work buffers, allocated once and overwritten every iteration
+    delta = np.empty((n, n, 2))
+    weight = np.empty((n, n))
+    disp = np.empty((n, 2))
+    disp_len = np.empty(n)
     for iter_count in range(iterations):
-        for v in nodes:
-            disp[v][0] = 0.0
-            disp[v][1] = 0.0
-        # repulsive
-        for v in nodes:
-            for u in nodes:
-                if u == v:
-                    continue
-                dx = positions[v][0] - positions[u][0]
-                dy = positions[v][1] - positions[u][1]
-                dist = sqrt(dx * dx + dy * dy) + 1e-9
-                force = (k * k) / dist
-                disp[v][0] += (dx / dist) * force
-                disp[v][1] += (dy / dist) * force
+        # repulsive: every pair, delta[v, u] = pos[v] - pos[u]
+        np.subtract(pos[:, None, :], pos[None, :, :], out=delta)
+        np.einsum("vuk,vuk->vu", delta, delta, out=weight)
+        np.sqrt(weight, out=weight)
+        weight += 1e-9
+        # force / dist = k^2 / dist^2
+        np.multiply(weight, weight, out=weight)
+        np.divide(k * k, weight, out=weight)
+        np.einsum("vuk,vu->vk", delta, weight, out=disp)
         # attractive (edges)
-        for v in nodes:
-            for u in adj[v]:
-                dx = positions[v][0] - positions[u][0]
-                dy = positions[v][1] - positions[u][1]
-                dist = sqrt(dx * dx + dy * dy) + 1e-9
-                force = (dist * dist) / k
-                disp[v][0] -= (dx / dist) * force
-                disp[v][1] -= (dy / dist) * force
+        delta_e = pos[src] - pos[indices]
+        dist_e = np.sqrt((delta_e * delta_e).sum(axis=-1)) + 1e-9
+        np.add.at(disp, src, -delta_e * (dist_e / k)[:, None])
         # limit max displacement by temperature and apply
-        for v in nodes:
-            dx, dy = disp[v]
-            disp_len = sqrt(dx * dx + dy * dy)
-            if disp_len > 1e-9:
-                x = positions[v][0] + (dx / disp_len) * min(disp_len, t)
-                y = positions[v][1] + (dy / disp_len) * min(disp_len, t)
-            else:
-                x, y = positions[v]
-            # keep inside box margins
-            margin = 40
-            x = min(width - margin, max(margin, x))
-            y = min(height - margin, max(margin, y))
-            positions[v] = (x, y)
+        np.einsum("vk,vk->v", disp, disp, out=disp_len)
+        np.sqrt(disp_len, out=disp_len)
+        moving = disp_len > 1e-9
+        scale = np.minimum(disp_len[moving], t) / disp_len[moving]
+        pos[moving] += disp[moving] * scale[:, None]
+        # keep inside box margins
+        np.clip(pos[:, 0], margin, width - margin, out=pos[:, 0])
+        np.clip(pos[:, 1], margin, height - margin, out=pos[:, 1])
         t -= dt
-    return positions
+    return {nid: (x, y) for nid, (x, y) in zip(ids, pos.tolist())}
 
 
 # ------------------ SVG Renderer ------------------
@@ -167,46 +320,45 @@ def render_svg(
     svg.append("<defs>" + ARROW_DEF + "</defs>")
     # background
     svg.append(f'<rect width="100%" height="100%" fill="#ffffff"/>')
-    # edges
-    for e in edges:
-        src = e["src"]
-        dst = e["dst"]
-        x1, y1 = positions[src]
-        x2, y2 = positions[dst]
+    # edges: endpoint geometry for all edges at once, one row per edge
+    if edges:
+        coords = chain.from_iterable(
+            (*positions[e["src"]], *positions[e["dst"]]) for e in edges
+        )
+        ends = np.fromiter(coords, float, 4 * len(edges)).reshape(-1, 4)
         # line offset to avoid overlapping node circle centers
-        dx = x2 - x1
-        dy = y2 - y1
-        dist = sqrt(dx * dx + dy * dy) + 1e-9
-        ox = (dx / dist) * node_radius
-        oy = (dy / dist) * node_radius
-        sx, sy = x1 + ox, y1 + oy
-        ex, ey = x2 - ox, y2 - oy
+        delta = ends[:, 2:] - ends[:, :2]
+        dist = np.sqrt((delta * delta).sum(axis=1)) + 1e-9
+        offset = delta / dist[:, None] * node_radius
+        ends[:, :2] += offset
+        ends[:, 2:] -= offset
         # simple straight line; could add bezier for curved edges later
         marker = ' marker-end="url(#arrow)"' if directed else ""
-        label = e.get("attr", {}).get("label", None)
-        svg.append(
-            f'<line x1="{sx:.2f}" y1="{sy:.2f}" x2="{ex:.2f}" y2="{ey:.2f}" stroke="#333" stroke-width="1.6"{marker} />'
+        line = (
+            '<line x1="%.2f" y1="%.2f" x2="%.2f" y2="%.2f" '
+            f'stroke="#333" stroke-width="1.6"{marker} />'
         )
-        if label:
-            lx, ly = (sx + ex) / 2, (sy + ey) / 2
-            svg.append(
-                f'<text x="{lx:.2f}" y="{ly - 6:.2f}" font-size="12" text-anchor="middle">{escape(label)}</text>'
-            )
-    # nodes (circles + labels)
+        for e, (sx, sy, ex, ey) in zip(edges, ends.tolist()):
+            svg.append(line % (sx, sy, ex, ey))
+            label = e.get("attr", {}).get("label", None)
+            if label:
+                lx, ly = (sx + ex) / 2, (sy + ey) / 2
+                svg.append(
+                    f'<text x="{lx:.2f}" y="{ly - 6:.2f}" font-size="12" text-anchor="middle">{escape(label)}</text>'
+                )
+    # nodes (circles + labels), one template fill per node
+    node_svg = (
+        '<g class="node">\n'
+        f'  <circle cx="%.2f" cy="%.2f" r="{node_radius}" fill="#f2f2f9" stroke="#333" stroke-width="1.4"/>\n'
+        '  <text x="%.2f" y="%.2f" font-size="12" text-anchor="middle">%s</text>'
+    )
     for nid, attr in nodes.items():
         x, y = positions[nid]
-        label = attr.get("label", nid)
+        svg.append(node_svg % (x, y, x, y + 4, escape(attr.get("label", nid))))
         title = attr.get("title", "")
-        svg.append(f'<g class="node">')
-        svg.append(
-            f'  <circle cx="{x:.2f}" cy="{y:.2f}" r="{node_radius}" fill="#f2f2f9" stroke="#333" stroke-width="1.4"/>'
-        )
-        svg.append(
-            f'  <text x="{x:.2f}" y="{y + 4:.2f}" font-size="12" text-anchor="middle">{escape(label)}</text>'
-        )
         if title:
             svg.append(f"  <title>{escape(title)}</title>")
-        svg.append(f"</g>")
+        svg.append("</g>")
     svg.append("</svg>")
     svg_text = "\n".join(svg)
     with open(filename, "w", encoding="utf-8") as f:
@@ -215,7 +367,8 @@ def render_svg(
 
 
 # ------------------ Example usage ------------------
-example_dot = r"""
+if __name__ == "__main__":
+    example_dot = r"""
 digraph G {
   node [shape=circle];
   rankdir=LR;
@@ -231,16 +384,15 @@ digraph G {
 }
 """
 
-graph = parse_dot(example_dot)
-positions = layout_force_directed(
-    graph["nodes"], graph["edges"], width=1200, height=800, iterations=400
-)
-out_path = render_svg(
-    graph,
-    positions,
-    filename=os.path.expanduser("~/Documents/output_graph.svg"),
-    width=1200,
-    height=800,
-)
-
-out_path
+    graph = parse_dot(example_dot)
+    positions = layout_force_directed(
+        graph["nodes"], graph["edges"], width=1200, height=800, iterations=400
+    )
+    out_path = render_svg(
+        graph,
+        positions,
+        filename=os.path.expanduser("~/Documents/output_graph.svg"),
+        width=1200,
+        height=800,
+    )
+    print(out_path)
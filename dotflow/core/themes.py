@@ -3,7 +3,8 @@ Theme definitions for consistent styling.
 """
 
 from enum import Enum
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from .models import NodeStyle, EdgeStyleConfig, EdgeStyle
 
 
@@ -66,14 +67,24 @@ class ThemeManager:
         },
     }
 
+    # Read-only views of _themes, built on first use per theme
+    _resolved: Dict[Theme, Mapping[str, Any]] = {}
+
     @classmethod
-    def get_theme_config(cls, theme: Theme) -> Dict[str, Any]:
+    def get_theme_config(cls, theme: Theme) -> Mapping[str, Any]:
         """Get configuration for a specific theme."""
-        return cls._themes.get(theme, cls._themes[Theme.DEFAULT])
+        config = cls._resolved.get(theme)
+        if config is None:
+            config = MappingProxyType(
+                dict(cls._themes.get(theme, cls._themes[Theme.DEFAULT]))
+            )
+            cls._resolved[theme] = config
+        return config
 
     @classmethod
     def register_theme(cls, name: str, config: Dict[str, Any]) -> Theme:
         """Register a custom theme."""
         theme = Theme(name)
         cls._themes[theme] = config
+        cls._resolved.pop(theme, None)
         return theme
@@ -2,8 +2,12 @@
 DOT file exporter.
 """
 
+from typing import TYPE_CHECKING
 from .base import FileExporter
 
+if TYPE_CHECKING:
+    from ..core.interpreter import DotInterpreter
+
 
 class DotExporter(FileExporter):
     """Exporter for DOT files."""
@@ -16,3 +20,12 @@ class DotExporter(FileExporter):
             f.write(dot_content)
 
         return output_path
+
+    def export_stream(self, flow: "DotInterpreter", output_path: str) -> str:
+        """Write a flow's DOT source to a .dot file as it is generated."""
+        self._ensure_directory(output_path)
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.writelines(flow.iter_dot())
+
+        return output_path
@@ -2,10 +2,11 @@
 Image exporter using Graphviz.
 """
 
+import shutil
 import tempfile
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 from ..utils.exceptions import ExportError, SystemValidationError
 from .base import FileExporter
 from ..utils.validators import SystemValidator
@@ -16,12 +17,16 @@ class ImageExporter(FileExporter):
 
     SUPPORTED_FORMATS = {"png", "svg", "pdf", "jpg", "gif"}
 
-    def __enter__():
+    def __enter__(self):
         """Validate Graphviz existence on enter"""
 
         check, error = SystemValidator().validate_graphviz_existense()
         if not check:
             raise SystemValidationError(error)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
 
     def export(
         self, dot_content: str, output_path: str, format: Optional[str] = None
@@ -35,19 +40,14 @@ class ImageExporter(FileExporter):
 
         self._ensure_directory(output_path)
 
-        # Write DOT code to temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".dot", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(dot_content)
-            dot_file = f.name
-
         try:
-            # Use Graphviz to render
+            # Use Graphviz to render, feeding the DOT source on stdin
             result = subprocess.run(
-                ["dot", f"-T{format}", dot_file, "-o", output_path],
+                ["dot", f"-T{format}", "-o", output_path],
+                input=dot_content,
                 capture_output=True,
                 text=True,
+                encoding="utf-8",
                 timeout=30,
             )
 
@@ -62,5 +62,90 @@ class ImageExporter(FileExporter):
                 "Graphviz not found. Please install Graphviz: "
                 "https://graphviz.org/download/"
             )
-        finally:
-            Path(dot_file).unlink(missing_ok=True)
+
+    def export_formats(
+        self, dot_content: str, output_paths: Sequence[str]
+    ) -> List[str]:
+        """
+        Export one DOT source to several files with a single Graphviz run.
+
+        Each path's suffix selects its format; Graphviz pairs every -T flag
+        with the -o that follows it, so the source is parsed and laid out once.
+        """
+        args = ["dot"]
+        for output_path in output_paths:
+            format = Path(output_path).suffix[1:].lower()
+            if format not in self.SUPPORTED_FORMATS:
+                raise ExportError(f"Unsupported format: {format}")
+            self._ensure_directory(output_path)
+            args += [f"-T{format}", "-o", output_path]
+
+        if not output_paths:
+            return []
+
+        try:
+            result = subprocess.run(
+                args,
+                input=dot_content,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                timeout=30 * len(output_paths),
+            )
+        except subprocess.TimeoutExpired:
+            raise ExportError("Graphviz rendering timed out")
+        except FileNotFoundError:
+            raise ExportError(
+                "Graphviz not found. Please install Graphviz: "
+                "https://graphviz.org/download/"
+            )
+
+        if result.returncode != 0:
+            raise ExportError(f"Graphviz error: {result.stderr}")
+        return list(output_paths)
+
+    def export_batch(self, jobs: Sequence[Tuple[str, str]], format: str) -> List[str]:
+        """
+        Export several (dot_content, output_path) pairs with one Graphviz run.
+
+        All sources are rendered by a single ``dot -O`` invocation, so the
+        process start-up cost is paid once rather than per diagram.
+        """
+        if format not in self.SUPPORTED_FORMATS:
+            raise ExportError(f"Unsupported format: {format}")
+
+        if not jobs:
+            return []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dot_files = []
+            for index, (dot_content, output_path) in enumerate(jobs):
+                self._ensure_directory(output_path)
+                dot_file = Path(tmp_dir) / f"{index}.dot"
+                dot_file.write_text(dot_content, encoding="utf-8")
+                dot_files.append(str(dot_file))
+
+            try:
+                # -O names each output <input>.<format> next to its source
+                result = subprocess.run(
+                    ["dot", f"-T{format}", "-O", *dot_files],
+                    capture_output=True,
+                    text=True,
+                    timeout=30 * len(dot_files),
+                )
+            except subprocess.TimeoutExpired:
+                raise ExportError("Graphviz rendering timed out")
+            except FileNotFoundError:
+                raise ExportError(
+                    "Graphviz not found. Please install Graphviz: "
+                    "https://graphviz.org/download/"
+                )
+
+            if result.returncode != 0:
+                raise ExportError(f"Graphviz error: {result.stderr}")
+
+            outputs = []
+            for dot_file, (_, output_path) in zip(dot_files, jobs):
+                shutil.move(f"{dot_file}.{format}", output_path)
+                outputs.append(output_path)
+            return outputs
@@ -1,55 +1,52 @@
 from dotflow import create_flow
 
+# (node_id, shape, label)
+_PLAIN_NODES = [
+    # User-Facing Services
+    ("User_Service", "component", "User Service"),
+    ("Auth_Service", "component", "Auth Service"),
+    # Core Business Services
+    ("Order_Service", "component", "Order Service"),
+    ("Payment_Service", "component", "Payment Service"),
+    ("Inventory_Service", "component", "Inventory Service"),
+    # Data & Support Services
+    ("Analytics_Service", "component", "Analytics Service"),
+    ("Notification_Service", "component", "Notification Service"),
+    # Databases
+    ("User_DB", "cylinder", "User DB"),
+    ("Order_DB", "cylinder", "Order DB"),
+]
+
 
 def create_microservices_architecture():
     # Create the main flow
     flow = create_flow("MicroserviceArchitecture", theme="blue")
     flow.direction = "TB"
     # flow.set_option("compound", True)
+    # Straight edges skip Graphviz's spline router, its costliest layout pass
+    flow.set_graph_attr("splines", "line")
 
     # Define all nodes with specific properties
     # User-Facing Services
-    api_gateway = flow.node(
+    flow.node(
         node_id="API_Gateway",
         shape="rectangle",
         style="rounded,filled",
         fillcolor="#d5f5e3",
         label="API Gateway\n(Routing/Auth)",
     )
-    user_service = flow.node("User_Service", shape="component", label="User Service")
-    auth_service = flow.node("Auth_Service", shape="component", label="Auth Service")
-
-    # Core Business Services
-    order_service = flow.node("Order_Service", shape="component", label="Order Service")
-    payment_service = flow.node(
-        "Payment_Service", shape="component", label="Payment Service"
-    )
-    inventory_service = flow.node(
-        "Inventory_Service", shape="component", label="Inventory Service"
-    )
-
-    # Data & Support Services
-    analytics_service = flow.node(
-        "Analytics_Service", shape="component", label="Analytics Service"
-    )
-    notification_service = flow.node(
-        "Notification_Service", shape="component", label="Notification Service"
-    )
-
-    # Databases
-    user_db = flow.node("User_DB", shape="cylinder", label="User DB")
-    order_db = flow.node("Order_DB", shape="cylinder", label="Order DB")
+    # Services and databases that only differ by id, shape and label
+    for node_id, shape, label in _PLAIN_NODES:
+        flow.node(node_id, shape=shape, label=label)
 
     # External Systems
-    external_gateway = flow.node(
+    flow.node(
         "External_Payment_Gateway",
         shape="rectangle",
         style="rounded,dashed",
         label="Stripe/PayPal",
     )
-    user_node = flow.node(
-        "User", label="User", shape="circle", fillcolor="#aed6f1", style="filled"
-    )
+    flow.node("User", label="User", shape="circle", fillcolor="#aed6f1", style="filled")
 
     # Create clusters (logical groupings)
     user_cluster = flow.cluster(
@@ -92,40 +89,42 @@ def create_microservices_architecture():
 
     # Define connections with proper labels and styles
     # Primary User Flow
-    flow.connect(user_node, api_gateway, label="HTTP Request")
+    flow.connect("User", "API_Gateway", label="HTTP Request")
 
     # Internal Service Communications
-    flow.connect(api_gateway, user_service, label="user_services")
-    flow.connect(api_gateway, auth_service, style="dashed", label="JWT Validate")
+    flow.connect("API_Gateway", "User_Service", label="user_services")
+    flow.connect("API_Gateway", "Auth_Service", style="dashed", label="JWT Validate")
 
-    flow.connect(user_service, user_db, arrowhead="obox", label="CRUD")
-    flow.connect(auth_service, user_db, arrowhead="obox", label="Auth Check")
+    flow.connect("User_Service", "User_DB", arrowhead="obox", label="CRUD")
+    flow.connect("Auth_Service", "User_DB", arrowhead="obox", label="Auth Check")
 
-    flow.connect(api_gateway, order_service, label="Create Order")
-    flow.connect(order_service, payment_service, label="Process Payment")
-    flow.connect(order_service, inventory_service, label="Check Stock")
-    flow.connect(order_service, order_db, arrowhead="obox", label="Persist")
+    flow.connect("API_Gateway", "Order_Service", label="Create Order")
+    flow.connect("Order_Service", "Payment_Service", label="Process Payment")
+    flow.connect("Order_Service", "Inventory_Service", label="Check Stock")
+    flow.connect("Order_Service", "Order_DB", arrowhead="obox", label="Persist")
 
-    flow.connect(payment_service, external_gateway, style="dashed", label="API Call")
+    flow.connect(
+        "Payment_Service", "External_Payment_Gateway", style="dashed", label="API Call"
+    )
 
     # Async Events & Notifications (dotted lines)
     flow.connect(
-        order_service,
-        analytics_service,
+        "Order_Service",
+        "Analytics_Service",
         style="dotted",
         color="blue",
         label="Order Placed (Event)",
     )
     flow.connect(
-        order_service,
-        notification_service,
+        "Order_Service",
+        "Notification_Service",
         style="dotted",
         color="green",
         label="Send Confirmation",
     )
     flow.connect(
-        payment_service,
-        notification_service,
+        "Payment_Service",
+        "Notification_Service",
         style="dotted",
         color="green",
         label="Payment Receipt",
@@ -138,11 +137,8 @@ def main():
     # Create the architecture
     architecture = create_microservices_architecture()
 
-    # Render to multiple formats
-    architecture.render("png", "microservices_pythonic.png")
-    architecture.render("svg", "microservices_pythonic.svg")
-    architecture.render("pdf", "microservices_pythonic.pdf")
-    architecture.render("dot", "microservices_pythonic.dot")
+    # Render to multiple formats; the images come from one Graphviz run
+    architecture.render_many(["png", "svg", "pdf", "dot"], "microservices_pythonic")
     print("Advanced microservices architecture generated successfully!")
     print("Files created: microservices_pythonic.png, [.svg, .pdf]")
 
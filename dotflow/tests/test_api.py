@@ -0,0 +1,58 @@
+"""
+Tests for the API layers.
+"""
+
+import io
+import pytest
+import subprocess
+import sys
+from ..core.interpreter import DotInterpreter
+from ..utils.exceptions import DSLParseError
+
+
+class TestTextualDSL:
+    def test_parse_dsl_stream(self):
+        flow = DotInterpreter()
+        flow.dsl.parse_dsl_stream(io.StringIO("A\nB\n\n# comment\nA -> B : Go\n"))
+        assert "A" in flow.nodes and "B" in flow.nodes
+        assert len(flow.edges) == 1
+        assert flow.edges[0].label == "Go"
+
+    def test_unknown_connection_reports_line(self):
+        flow = DotInterpreter()
+        with pytest.raises(DSLParseError, match="line 3: B -> Missing"):
+            flow.dsl.parse_dsl_stream(io.StringIO("A\nB\nB -> Missing\nA -> B\n"))
+
+    def test_node_definition_ids_are_validated(self):
+        with pytest.raises(DSLParseError):
+            DotInterpreter().parse_dsl("a\u00b2 [shape=box]")
+
+
+class TestNaturalLanguageAPI:
+    def test_build_matches_operators(self):
+        chained = DotInterpreter().process("B").process("C")
+        (chained >> "A" >> "B" | "Yes") >> "C"
+
+        built = DotInterpreter().process("B").process("C")
+        built.build([("node", "A"), ("node", "B"), ("label", "Yes"), ("node", "C")])
+
+        assert built.to_dot() == chained.to_dot()
+        assert built.edges[1].label == "Yes"
+
+    def test_relabelled_edge_renders_new_label(self):
+        flow = DotInterpreter().process("B")
+        hop = flow >> "A" >> "B"
+        flow.to_dot()
+        hop["x&y"]
+        assert 'A -> B [label="x&amp;y"];' in flow.to_dot()
+
+
+class TestPackage:
+    def test_cli_is_the_group_in_any_import_order(self):
+        check = "import click; assert isinstance(dotflow.cli, click.Group)"
+        for imports in (
+            "import dotflow",
+            "import dotflow.cli.main, dotflow",
+            "from dotflow import cli as group; import dotflow",
+        ):
+            subprocess.run([sys.executable, "-c", f"{imports}; {check}"], check=True)
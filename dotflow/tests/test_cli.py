@@ -4,9 +4,11 @@ Tests for CLI functionality.
 
 import pytest
 from click.testing import CliRunner
-from .dotflow.cli.main import cli
+from ..cli.main import cli, InterractiveSession
+from ..core.interpreter import DotInterpreter
 import tempfile
 import os
+from pathlib import Path
 
 
 class TestCLI:
@@ -103,3 +105,36 @@ class TestCLI:
                 assert "cheat sheet" in result.output.lower()
             finally:
                 os.chdir(old_cwd)
+
+
+class TestInteractiveSession:
+    def test_checkpoint_paths(self):
+        session = InterractiveSession(DotInterpreter(name="flow"), output="out/a.png")
+        assert session._checkpoint_path == Path("out/a_checkpoint.dot")
+        assert session._preview_path == Path("out/a_preview.png")
+
+    def test_checkpoint_paths_for_current_directory(self):
+        session = InterractiveSession(DotInterpreter(name="flow"), output=os.curdir)
+        assert session._checkpoint_path == Path("flow_checkpoint.dot")
+        assert session._preview_path == Path("flow_preview.png")
+
+
+class TestExamplesFallback:
+    def test_failed_batch_retries_each_example(self, tmp_path, monkeypatch):
+        from ..exporters.image import ImageExporter
+        from ..utils.exceptions import ExportError
+
+        def export_batch(self, jobs, format):
+            raise ExportError("Graphviz error")
+
+        def export(self, dot_content, output_path, format=None):
+            if "simple_flow" in output_path:
+                raise ExportError("Graphviz error")
+            return output_path
+
+        monkeypatch.setattr(ImageExporter, "export_batch", export_batch)
+        monkeypatch.setattr(ImageExporter, "export", export)
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(cli, ["examples", "--format", "png"])
+        assert "Failed to generate simple_flow" in result.output
+        assert result.output.count("Generated") == 3
@@ -2,12 +2,30 @@
 Tests for core functionality.
 """
 
-import pytest
+import sys
+import weakref
 from ..core.interpreter import DotInterpreter
-from ..core.models import NodeShape  # , Direction
+from ..core.models import Edge, Node, NodeShape, NodeStyle  # , Direction
 from ..utils.exceptions import NodeNotFoundError, ValidationError
 from ..core.themes import Theme
 
+if "pytest" in sys.modules:
+    from pytest import raises as _raises
+else:
+    # tester.py runs these tests directly; skip importing pytest for it
+
+    class _raises:
+        def __init__(self, expected):
+            self.expected = expected
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            if exc_type is None:
+                raise AssertionError(f"DID NOT RAISE {self.expected.__name__}")
+            return issubclass(exc_type, self.expected)
+
 
 class TestDotInterpreter:
     def test_basic_creation(self):
@@ -31,10 +49,110 @@ class TestDotInterpreter:
     def test_node_not_found(self):
         flow = DotInterpreter()
         flow.start("A")
-        with pytest.raises(NodeNotFoundError):
+        with _raises(NodeNotFoundError):
             flow.connect("A", "Nonexistent")
 
     def test_invalid_node_id(self):
         flow = DotInterpreter()
-        with pytest.raises(ValidationError):
+        with _raises(ValidationError):
             flow.start("invalid-node")
+
+    def test_errors_support_weakrefs(self):
+        error = ValidationError("bad")
+        assert weakref.ref(error)() is error
+
+    def test_connect_many(self):
+        flow = DotInterpreter()
+        flow.start("A").process("B").process("C")
+        flow.connect_many([("A", "B", "Next", None), ("B", "C", None, None)])
+        assert [(e.from_node, e.to_node) for e in flow.edges] == [
+            ("A", "B"),
+            ("B", "C"),
+        ]
+        with _raises(NodeNotFoundError):
+            flow.connect_many([("A", "C", None, None), ("C", "Missing", None, None)])
+        assert len(flow.edges) == 2
+
+    def test_to_dot_refreshes_after_changes(self):
+        flow = DotInterpreter()
+        flow.start("A")
+        first = flow.to_dot()
+        assert flow.to_dot() is first
+        flow.process("B").connect("A", "B")
+        assert "A -> B" in flow.to_dot()
+
+    def test_to_dot_after_direct_changes(self):
+        flow = DotInterpreter("first")
+        flow.start("A")
+        flow.to_dot()
+        flow.name = "second"
+        assert flow.to_dot().startswith("digraph second {")
+        flow.nodes["A"].label = "Renamed"
+        flow.clear_dot_cache()
+        assert 'label="Renamed"' in flow.to_dot()
+
+    def test_link_and_relabel_edge(self):
+        flow = DotInterpreter()
+        edge = flow.start("A").process("B").link("A", "B")
+        assert flow.edges == [edge]
+        flow.to_dot()
+        flow.relabel_edge(edge, "Go")
+        assert 'A -> B [label="Go"];' in flow.to_dot()
+
+    def test_connect_shares_default_edge_style(self):
+        flow = DotInterpreter().start("A").process("B")
+        assert flow.connect("A", "B").edges[-1].style is flow._default_edge_style
+        edge = flow.link("A", "B", arrowhead="vee", arrowtail="dot")
+        assert (edge.style.arrowhead, edge.style.arrowtail) == ("vee", "dot")
+
+    def test_freeze_node_namespace(self):
+        flow = DotInterpreter()
+        flow.start("A").process("B").freeze_node_namespace().connect("A", "B")
+        with _raises(NodeNotFoundError):
+            flow.connect("B", "C")
+        flow.process("C").connect("B", "C")
+        assert len(flow.edges) == 2
+
+    def test_iter_dot_matches_to_dot(self):
+        flow = DotInterpreter()
+        flow.start("A").process("B").connect("A", "B", "Go")
+        assert "".join(flow.iter_dot()) == flow.to_dot()
+
+    def test_standalone_to_dot_writes_every_style_field(self):
+        node = Node("A", "A", NodeShape.RECTANGLE, NodeStyle())
+        assert node.to_dot() == (
+            'A [label="A", shape=rect, color="black", fillcolor="white", '
+            'fontcolor="black", fontsize=12, fontname="Arial", style="filled", '
+            "width=0.75, height=0.5];"
+        )
+        assert Edge("A", "B").to_dot() == (
+            'A -> B [style=solid, arrowhead="arrow", color="black", '
+            'fontcolor="black", fontsize=10];'
+        )
+
+    def test_replaced_cluster_drops_its_nodes(self):
+        flow = DotInterpreter()
+        flow.start("A")
+        with flow.cluster("group", "Group"):
+            flow.process("X")
+        with flow.cluster("group", "Group"):
+            flow.process("Y")
+        flow.connect("A", "Y")
+        with _raises(NodeNotFoundError):
+            flow.connect("A", "X")
+
+    def test_cluster_keeps_parallel_edges(self):
+        flow = DotInterpreter()
+        with flow.cluster("group", "Group"):
+            flow.process("X").process("Y")
+            flow.connect("X", "Y", color="red")
+            flow.connect("X", "Y", color="blue")
+        assert len(flow.clusters["group"].edges) == 2
+
+    def test_to_dot_skips_theme_defaults(self):
+        flow = DotInterpreter()
+        flow.process("A").end("B").connect("A", "B")
+        dot = flow.to_dot()
+        assert 'A [label="A", shape=rect];' in dot
+        assert 'B [label="B", shape=ellipse, fillcolor="#ffcccc"];' in dot
+        assert "A -> B;" in dot
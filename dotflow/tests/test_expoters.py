@@ -0,0 +1,53 @@
+"""
+Tests for the exporters.
+"""
+
+import pytest
+import shutil
+from ..core.interpreter import DotInterpreter
+from ..exporters.image import ImageExporter
+from ..utils.exceptions import ExportError
+
+needs_graphviz = pytest.mark.skipif(
+    shutil.which("dot") is None, reason="Graphviz is not installed"
+)
+
+
+def _dot(*names):
+    flow = DotInterpreter()
+    for name in names:
+        flow.process(name)
+    return flow.to_dot()
+
+
+class TestImageExporter:
+    @needs_graphviz
+    def test_export_batch(self, tmp_path):
+        jobs = [(_dot("A", "B"), str(tmp_path / "one.svg"))]
+        jobs.append((_dot("C"), str(tmp_path / "nested" / "two.svg")))
+        assert ImageExporter().export_batch(jobs, "svg") == [p for _, p in jobs]
+        assert "<svg" in (tmp_path / "one.svg").read_text()
+        assert "<svg" in (tmp_path / "nested" / "two.svg").read_text()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["nested", "one.svg"]
+
+    @needs_graphviz
+    def test_export_batch_rejects_broken_source(self, tmp_path):
+        jobs = [(_dot("A"), str(tmp_path / "ok.svg"))]
+        jobs.append(("digraph {", str(tmp_path / "broken.svg")))
+        with pytest.raises(ExportError):
+            ImageExporter().export_batch(jobs, "svg")
+
+    @needs_graphviz
+    def test_export_formats(self, tmp_path):
+        paths = [str(tmp_path / "flow.svg"), str(tmp_path / "flow.png")]
+        assert ImageExporter().export_formats(_dot("A"), paths) == paths
+        assert "<svg" in (tmp_path / "flow.svg").read_text()
+        assert (tmp_path / "flow.png").read_bytes().startswith(b"\x89PNG")
+
+    def test_unsupported_formats(self, tmp_path):
+        with pytest.raises(ExportError):
+            ImageExporter().export_batch([(_dot("A"), str(tmp_path / "a.x"))], "x")
+        with pytest.raises(ExportError):
+            ImageExporter().export_formats(_dot("A"), [str(tmp_path / "a.x")])
+        assert ImageExporter().export_batch([], "svg") == []
+        assert ImageExporter().export_formats(_dot("A"), []) == []
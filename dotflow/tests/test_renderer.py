@@ -0,0 +1,253 @@
+"""
+Tests for the standalone DOT renderer.
+"""
+
+import pytest
+from math import sqrt
+from xml.sax.saxutils import escape
+
+np = pytest.importorskip("numpy")
+
+from ..core import renderer
+from ..core.renderer import (
+    ARROW_DEF,
+    layout_force_directed,
+    parse_attrs,
+    parse_dot,
+    render_svg,
+)
+
+
+def _reference_layout(nodes, edges, start, width, height, iterations):
+    # The original per-node loops, started from fixed positions
+    n = len(nodes)
+    positions = dict(start)
+    k = sqrt(width * height / n)
+    t = max(width, height) / 10.0
+    dt = t / (iterations + 1.0)
+    adj = {nid: set() for nid in nodes}
+    for e in edges:
+        adj[e["src"]].add(e["dst"])
+        adj[e["dst"]].add(e["src"])
+    for _ in range(iterations):
+        disp = {}
+        for v in nodes:
+            dx_sum = dy_sum = 0.0
+            for u in nodes:
+                if u != v:
+                    dx = positions[v][0] - positions[u][0]
+                    dy = positions[v][1] - positions[u][1]
+                    dist = sqrt(dx * dx + dy * dy) + 1e-9
+                    dx_sum += dx / dist * (k * k) / dist
+                    dy_sum += dy / dist * (k * k) / dist
+            for u in adj[v]:
+                dx = positions[v][0] - positions[u][0]
+                dy = positions[v][1] - positions[u][1]
+                dist = sqrt(dx * dx + dy * dy) + 1e-9
+                dx_sum -= dx / dist * (dist * dist) / k
+                dy_sum -= dy / dist * (dist * dist) / k
+            disp[v] = (dx_sum, dy_sum)
+        for v, (dx, dy) in disp.items():
+            x, y = positions[v]
+            disp_len = sqrt(dx * dx + dy * dy)
+            if disp_len > 1e-9:
+                x += dx / disp_len * min(disp_len, t)
+                y += dy / disp_len * min(disp_len, t)
+            positions[v] = (min(width - 40, max(40, x)), min(height - 40, max(40, y)))
+        t -= dt
+    return positions
+
+
+def _start_positions(nodes, width, height, seed):
+    # the initial positions layout_force_directed draws for the same seed
+    np.random.seed(seed)
+    xs = np.random.uniform(50, width - 50, len(nodes))
+    ys = np.random.uniform(50, height - 50, len(nodes))
+    return dict(zip(nodes, zip(xs.tolist(), ys.tolist())))
+
+
+class TestParser:
+    def test_edge_chain(self):
+        graph = parse_dot('digraph { a -> b -> c [label="x"]; }')
+        assert graph["directed"]
+        assert list(graph["nodes"]) == ["a", "b", "c"]
+        assert [(e["src"], e["dst"]) for e in graph["edges"]] == [
+            ("a", "b"),
+            ("b", "c"),
+        ]
+        assert all(e["attr"] == {"label": "x"} for e in graph["edges"])
+
+    def test_default_statements(self):
+        graph = parse_dot(
+            "graph G { graph [rankdir=LR]; node [shape=box]; edge [color=red];"
+            " rankdir=TB; a -- b; }"
+        )
+        assert not graph["directed"]
+        assert graph["nodes"] == {"a": {}, "b": {}}
+        assert graph["edges"] == [{"src": "a", "dst": "b", "attr": {}}]
+
+    def test_ports(self):
+        graph = parse_dot("digraph { a:p1:n -> b:s [color=blue]; }")
+        assert list(graph["nodes"]) == ["a", "b"]
+        assert graph["edges"] == [{"src": "a", "dst": "b", "attr": {"color": "blue"}}]
+
+    def test_quoted_strings(self):
+        graph = parse_dot(
+            r'digraph { "node one" [label="say \"hi\"; a -> b"]; "node one" -> x; }'
+        )
+        assert graph["nodes"]["node one"] == {"label": 'say "hi"; a -> b'}
+        assert [(e["src"], e["dst"]) for e in graph["edges"]] == [("node one", "x")]
+
+    def test_html_label(self):
+        graph = parse_dot("digraph { a [label=<<b>bold</b> <i>x</i>>]; }")
+        assert graph["nodes"]["a"] == {"label": "<b>bold</b> <i>x</i>"}
+
+    def test_comments(self):
+        graph = parse_dot(
+            "# preprocessor line\n"
+            "digraph {\n"
+            "  a -> b; // c -> d\n"
+            "  /* e -> f;\n"
+            "     g */\n"
+            "  # h -> i\n"
+            '  j [color="#ff0000"];\n'
+            "}\n"
+        )
+        assert list(graph["nodes"]) == ["a", "b", "j"]
+        assert graph["nodes"]["j"] == {"color": "#ff0000"}
+        assert len(graph["edges"]) == 1
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('label="Hi", color=red', {"label": "Hi", "color": "red"}),
+            ("width=1.5; weight=-2", {"width": "1.5", "weight": "-2"}),
+            ("label='a, b' shape=box", {"label": "a, b", "shape": "box"}),
+            (r'label="a \"b\""', {"label": 'a "b"'}),
+            ("label=<<b>x</b>>", {"label": "<b>x</b>"}),
+            ("", {}),
+        ],
+    )
+    def test_parse_attrs(self, text, expected):
+        assert parse_attrs(text) == expected
+
+
+def _reference_svg(graph, positions, width, height):
+    # The original per-edge string formatting of render_svg
+    marker = ' marker-end="url(#arrow)"' if graph["directed"] else ""
+    svg = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        "<defs>" + ARROW_DEF + "</defs>",
+        '<rect width="100%" height="100%" fill="#ffffff"/>',
+    ]
+    for e in graph["edges"]:
+        x1, y1 = positions[e["src"]]
+        x2, y2 = positions[e["dst"]]
+        dx = x2 - x1
+        dy = y2 - y1
+        dist = sqrt(dx * dx + dy * dy) + 1e-9
+        ox = (dx / dist) * 18
+        oy = (dy / dist) * 18
+        sx, sy = x1 + ox, y1 + oy
+        ex, ey = x2 - ox, y2 - oy
+        svg.append(
+            f'<line x1="{sx:.2f}" y1="{sy:.2f}" x2="{ex:.2f}" y2="{ey:.2f}" stroke="#333" stroke-width="1.6"{marker} />'
+        )
+        label = e.get("attr", {}).get("label", None)
+        if label:
+            lx, ly = (sx + ex) / 2, (sy + ey) / 2
+            svg.append(
+                f'<text x="{lx:.2f}" y="{ly - 6:.2f}" font-size="12" text-anchor="middle">{escape(label)}</text>'
+            )
+    for nid, attr in graph["nodes"].items():
+        x, y = positions[nid]
+        svg.append('<g class="node">')
+        svg.append(
+            f'  <circle cx="{x:.2f}" cy="{y:.2f}" r="18" fill="#f2f2f9" stroke="#333" stroke-width="1.4"/>'
+        )
+        svg.append(
+            f'  <text x="{x:.2f}" y="{y + 4:.2f}" font-size="12" text-anchor="middle">{escape(attr.get("label", nid))}</text>'
+        )
+        if attr.get("title"):
+            svg.append(f"  <title>{escape(attr['title'])}</title>")
+        svg.append("</g>")
+    svg.append("</svg>")
+    return "\n".join(svg)
+
+
+_GRAPHS = {
+    "single": (["a"], []),
+    "no_edges": (["a", "b", "c"], []),
+    "self_loop": (["a", "b"], [("a", "a"), ("a", "b")]),
+    "duplicate_edges": (
+        ["a", "b", "c"],
+        [("a", "b"), ("a", "b"), ("b", "a"), ("b", "c")],
+    ),
+    "chain": (
+        ["a", "b", "c", "d", "e"],
+        [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e"), ("e", "a")],
+    ),
+}
+
+
+class TestLayout:
+    width, height, iterations = 600, 400, 60
+
+    def _graph(self, name):
+        ids, pairs = _GRAPHS[name]
+        return {nid: {} for nid in ids}, [{"src": s, "dst": d} for s, d in pairs]
+
+    @pytest.mark.parametrize("name", sorted(_GRAPHS))
+    def test_numpy_matches_reference(self, name, monkeypatch):
+        monkeypatch.setattr(renderer, "numba", None)
+        nodes, edges = self._graph(name)
+        start = _start_positions(nodes, self.width, self.height, seed=7)
+        expected = _reference_layout(
+            nodes, edges, start, self.width, self.height, self.iterations
+        )
+        np.random.seed(7)
+        result = layout_force_directed(
+            nodes, edges, self.width, self.height, self.iterations
+        )
+        assert list(result) == list(nodes)
+        for nid in nodes:
+            assert result[nid] == pytest.approx(expected[nid], rel=1e-6, abs=1e-6)
+
+    def test_empty_graph(self):
+        assert layout_force_directed({}, []) == {}
+
+    @pytest.mark.parametrize("name", sorted(_GRAPHS))
+    def test_numba_matches_numpy(self, name, monkeypatch):
+        pytest.importorskip("numba")
+        nodes, edges = self._graph(name)
+        np.random.seed(11)
+        jitted = layout_force_directed(
+            nodes, edges, self.width, self.height, self.iterations
+        )
+        monkeypatch.setattr(renderer, "numba", None)
+        np.random.seed(11)
+        expected = layout_force_directed(
+            nodes, edges, self.width, self.height, self.iterations
+        )
+        for nid in nodes:
+            assert jitted[nid] == pytest.approx(expected[nid], rel=1e-6, abs=1e-6)
+
+
+class TestRenderSVG:
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_matches_per_edge_output(self, directed, tmp_path):
+        graph = parse_dot(
+            'digraph { a -> b [label="x < y"]; b -> c; c -> a; a -> a;'
+            ' d [label="D", title="t&t"]; }'
+        )
+        graph["directed"] = directed
+        # tuples, lists and NumPy rows are all valid positions
+        positions = {
+            "a": (100.0, 120.5),
+            "b": [310.25, 80.0],
+            "c": np.array([220.0, 400.125]),
+            "d": (512.333, 64.0),
+        }
+        path = render_svg(graph, positions, str(tmp_path / "g.svg"), 640, 480)
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == _reference_svg(graph, positions, 640, 480)
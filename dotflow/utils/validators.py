@@ -2,13 +2,18 @@
 Validation utilities.
 """
 
-import re
-import subprocess
+import shutil
+from functools import lru_cache
 from typing import Any, Tuple
 from pathlib import Path
 from .exceptions import ValidationError
 
 
+def _is_node_id(node_id: str) -> bool:
+    # Same ids as [a-zA-Z_]\w*, checked without the regex engine
+    return node_id.isidentifier() and node_id[0].isascii()
+
+
 def validate_node_id(node_id: str) -> None:
     """Validate node ID format."""
     if "[" in node_id:
@@ -16,7 +21,7 @@ def validate_node_id(node_id: str) -> None:
     if not node_id:
         raise ValidationError("Node ID cannot be empty")
 
-    if not re.match(r"^[a-zA-Z_]\w*$", node_id):
+    if not _is_node_id(node_id):
         raise ValidationError(
             f"Invalid node ID: '{node_id}'. "
             "Must start with a letter or underscore and contain only "
@@ -26,12 +31,7 @@ def validate_node_id(node_id: str) -> None:
 
 def node_id_validator(node_id: str) -> bool:
     """Validate node ID format."""
-    if not node_id:
-        return False
-
-    if not re.match(r"^[a-zA-Z_]\w*$", node_id):
-        return False
-    return True
+    return bool(node_id) and _is_node_id(node_id)
 
 
 def validate_label(label: str) -> None:
@@ -60,19 +60,12 @@ class SystemValidator:
     """Validates system requirements and dependencies."""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def validate_graphviz_existense() -> Tuple[bool, str]:
-        """Check if Mermaid CLI is installed and accessible."""
-        try:
-            result = subprocess.run(
-                ["dot", "-V"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                return True, "Graphviz detected"
-            else:
-                return False, "Graphviz not properly installed"
-
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
-            return False, f"Graphviz check failed: {str(e)}"
+        """Check that the Graphviz dot binary is on PATH (cached per process)."""
+        if shutil.which("dot") is not None:
+            return True, "Graphviz detected"
+        return False, "Graphviz check failed: 'dot' executable not found on PATH"
 
     @staticmethod
     def validate_file_permissions(temp_dir: Path) -> Tuple[bool, str]:
@@ -1,11 +1,4 @@
 from dotflow import create_flow, Theme
-import warnings
-
-warnings.filterwarnings(
-    action="ignore",
-    category=SyntaxWarning,
-    message="str indices must be integers or slices, not str; perhaps you missed a comma?",
-)
 
 
 def demo_pythonic_api():
@@ -1,9 +1,18 @@
 import os
-from setuptools import find_namespace_packages, setup
+from setuptools import setup
 
 
 DESCRIPTION = "A Python-based DOT language interpreter with multiple API styles"
-EXCLUDE_FROM_PACKAGES = ["build", "dist", "test", "src", "*~", "*.db"]
+PACKAGES = [
+    "dotflow",
+    "dotflow.api",
+    "dotflow.cli",
+    "dotflow.core",
+    "dotflow.exporters",
+    "dotflow.tests",
+    "dotflow.utils",
+    "dotflow_examples",
+]
 
 
 setup(
@@ -11,7 +20,7 @@ setup(
     author="wambua",
     author_email="swskye17@gmail.com",
     version=open(os.path.abspath("version.txt")).read(),
-    packages=find_namespace_packages(exclude=EXCLUDE_FROM_PACKAGES),
+    packages=PACKAGES,
     description=DESCRIPTION,
     long_description=open("README.md").read(),
     long_description_content_type="text/markdown",
@@ -27,6 +36,11 @@ setup(
         "wheel",
         "argparse",
     ],
+    extras_require={
+        # dotflow.core.renderer: NumPy layout, optional Numba JIT kernel
+        "render": ["numpy"],
+        "jit": ["numpy", "numba"],
+    },
     include_package_data=True,
     package_data={
         "dotflow": ["tests/**"],
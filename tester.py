@@ -1,8 +1,13 @@
 from dotflow.tests.test_core import TestDotInterpreter
 
-core_tester = TestDotInterpreter()
-core_tester.test_basic_creation()
-core_tester.test_connection()
-core_tester.test_invalid_node_id()
-core_tester.test_node_creation()
-core_tester.test_node_not_found()
+CORE_TESTS = [
+    "test_basic_creation",
+    "test_connection",
+    "test_invalid_node_id",
+    "test_node_creation",
+    "test_node_not_found",
+]
+
+for name in CORE_TESTS:
+    # A fresh instance per test, as pytest does, keeps them order-independent
+    getattr(TestDotInterpreter(), name)()